@@ -0,0 +1,215 @@
+"""On-disk caches: loader results (one Parquet file per endpoint + arguments), raw API
+response bodies (one file per endpoint + query parameters) and whole table sets (one
+directory of Parquet files per name + arguments, e.g. a completed season)."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import math
+import os
+import shutil
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+log = logging.getLogger(__name__)
+
+# Empty string disables the cache.
+CACHE_DIR = os.getenv("NBA_CACHE_DIR", ".cache/nba")
+SHORT_TTL_SECONDS = float(os.getenv("NBA_CACHE_SHORT_TTL_SECONDS", "900"))
+FOREVER = math.inf
+
+Loader = Callable[..., Awaitable[pd.DataFrame]]
+Ttl = float | Callable[[Mapping[str, Any], pd.DataFrame], float]
+
+
+def _digest(arguments: Mapping[str, Any]) -> str:
+    """Stable key for a set of arguments (order-independent)."""
+    key = json.dumps(dict(arguments), sort_keys=True, default=str)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _entry_path(endpoint: str, arguments: Mapping[str, Any]) -> Path:
+    """Path of the cache entry for one call: CACHE_DIR/endpoint/<sha256 of args>.parquet."""
+    return Path(CACHE_DIR) / endpoint / f"{_digest(arguments)}.parquet"
+
+
+def _body_path(endpoint: str, params: Mapping[str, Any]) -> Path:
+    """Path of a cached response body: CACHE_DIR/http/endpoint/<sha256 of params>.json."""
+    return Path(CACHE_DIR) / "http" / endpoint / f"{_digest(params)}.json"
+
+
+def _read(path: Path) -> pd.DataFrame | None:
+    """Read a cache entry; None when missing or unreadable."""
+    try:
+        return pd.read_parquet(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def _write(path: Path, df: pd.DataFrame) -> None:
+    """Write a cache entry atomically (temp file + rename)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    df.to_parquet(tmp, index=False)
+    os.replace(tmp, path)
+
+
+def _tables_dir(name: str, arguments: Mapping[str, Any]) -> Path:
+    """Directory of a cached table set: CACHE_DIR/name/<sha256 of args>/."""
+    return Path(CACHE_DIR) / name / _digest(arguments)
+
+
+def read_tables(name: str, arguments: Mapping[str, Any]) -> dict[str, pd.DataFrame] | None:
+    """Return a table set stored by write_tables, or None when disabled or missing.
+
+    Args:
+        name (str): Cache namespace (e.g. load_all_raw).
+        arguments (Mapping[str, Any]): Arguments the tables were produced with.
+
+    Returns:
+        dict[str, pd.DataFrame] | None: Tables by name.
+    """
+    if not CACHE_DIR:
+        return None
+    path = _tables_dir(name, arguments)
+    if not path.is_dir():
+        return None
+    try:
+        return {f.stem: pd.read_parquet(f) for f in sorted(path.glob("*.parquet"))}
+    except Exception as e:
+        log.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def write_tables(
+    name: str, arguments: Mapping[str, Any], tables: Mapping[str, pd.DataFrame]
+) -> None:
+    """Store a table set for read_tables (zstd Parquet, one file per table).
+
+    The set is written to a temporary directory and renamed into place, so readers
+    never see a partial set; failures only log a warning.
+
+    Args:
+        name (str): Cache namespace (e.g. load_all_raw).
+        arguments (Mapping[str, Any]): Arguments the tables were produced with.
+        tables (Mapping[str, pd.DataFrame]): Tables by name.
+    """
+    if not CACHE_DIR:
+        return
+    path = _tables_dir(name, arguments)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.mkdir(parents=True, exist_ok=True)
+        for table, df in tables.items():
+            df.to_parquet(tmp / f"{table}.parquet", index=False, compression="zstd")
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp, path)
+    except (OSError, ValueError, TypeError) as e:
+        log.warning("Could not write cache entry %s: %s", path, e)
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def read_body(endpoint: str, params: Mapping[str, Any], ttl: float) -> bytes | None:
+    """Return the cached response body for endpoint + params if younger than ttl.
+
+    Args:
+        endpoint (str): API endpoint path (e.g. commonplayerinfo).
+        params (Mapping[str, Any]): Query parameters of the request.
+        ttl (float): Maximum entry age in seconds.
+
+    Returns:
+        bytes | None: Raw body as written by write_body; None when disabled, missing or expired.
+    """
+    if not CACHE_DIR:
+        return None
+    path = _body_path(endpoint, params)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return path.read_bytes()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        log.warning("Ignoring unreadable cache entry %s: %s", path, e)
+        return None
+
+
+def write_body(endpoint: str, params: Mapping[str, Any], body: bytes) -> None:
+    """Store a response body for read_body; failures only log a warning.
+
+    Args:
+        endpoint (str): API endpoint path (e.g. commonplayerinfo).
+        params (Mapping[str, Any]): Query parameters of the request.
+        body (bytes): Raw (already validated) JSON response body.
+    """
+    if not CACHE_DIR:
+        return
+    path = _body_path(endpoint, params)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(body)
+        os.replace(tmp, path)
+    except OSError as e:
+        log.warning("Could not write cache entry %s: %s", path, e)
+
+
+def cached(endpoint: str, ttl: Ttl = FOREVER) -> Callable[[Loader], Loader]:
+    """Cache an async DataFrame loader on disk, keyed by endpoint + its arguments.
+
+    A fresh entry is returned without calling the loader. If the loader raises and an
+    expired entry exists, the stale entry is served with a warning instead.
+
+    Args:
+        endpoint (str): Endpoint name; entries live under CACHE_DIR/endpoint/.
+        ttl (float | Callable, optional): Entry lifetime in seconds, or a callable
+            (arguments, cached_df) -> seconds for entries that only become immutable
+            later (e.g. once a game date is in the past). Defaults to FOREVER.
+
+    Returns:
+        Callable: Decorator for an async loader returning pd.DataFrame.
+    """
+
+    def decorate(fn: Loader) -> Loader:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> pd.DataFrame:
+            if not CACHE_DIR:
+                return await fn(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            path = _entry_path(endpoint, bound.arguments)
+            entry = _read(path)
+            if entry is not None:
+                lifetime = ttl(bound.arguments, entry) if callable(ttl) else ttl
+                if time.time() - path.stat().st_mtime < lifetime:
+                    log.debug("cache hit %s %s", endpoint, path.name)
+                    return entry
+            try:
+                df = await fn(*args, **kwargs)
+            except Exception as e:
+                if entry is None:
+                    raise
+                log.warning("%s failed (%s); serving stale cache entry %s", endpoint, e, path)
+                return entry
+            try:
+                _write(path, df)
+            except OSError as e:
+                log.warning("Could not write cache entry %s: %s", path, e)
+            return df
+
+        return wrapper
+
+    return decorate
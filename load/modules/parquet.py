@@ -0,0 +1,179 @@
+"""Parquet output: raw tables as season/season_type partitioned datasets."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from load.modules import utils
+
+log = logging.getLogger(__name__)
+
+PARTITION_COLS = ("season", "season_type")
+
+
+def write_partitioned(df: pd.DataFrame, root: Path, name: str) -> None:
+    """Write one table to root/name, partitioned by season (and season_type if present).
+
+    Partitions being written are replaced, so reloading a season is idempotent and
+    other seasons already on disk are left intact.
+
+    Args:
+        df: Table to write.
+        root: Dataset root directory.
+        name: Table name; becomes the dataset directory under root.
+    """
+    if df.empty:
+        log.debug("Skipping empty parquet table: %s", name)
+        return
+    partition_cols = [c for c in PARTITION_COLS if c in df.columns]
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(
+        table,
+        root_path=str(Path(root) / name),
+        partition_cols=partition_cols or None,
+        compression="zstd",
+        existing_data_behavior="delete_matching",
+    )
+    log.info("  wrote %s/%s: %d rows", root, name, len(df))
+
+
+def read_partitioned(
+    root: Path,
+    name: str,
+    columns: list[str] | None = None,
+    season: str | None = None,
+    season_type: str | None = None,
+) -> pd.DataFrame:
+    """Read a dataset written by write_partitioned, optionally pruned to one season.
+
+    Args:
+        root: Dataset root directory.
+        name: Table name under root.
+        columns: Only load these columns (columnar read).
+        season: Only load this season partition.
+        season_type: Only load this season_type partition.
+
+    Returns:
+        pd.DataFrame: Matching rows; empty if the dataset does not exist.
+    """
+    path = Path(root) / name
+    if not path.exists():
+        return pd.DataFrame()
+    # Partition values are strings ("2026"); stop pyarrow inferring them as ints.
+    present = [c for i, c in enumerate(PARTITION_COLS) if any(path.glob("*/" * i + f"{c}=*"))]
+    partitioning = ds.partitioning(pa.schema([(c, pa.string()) for c in present]), flavor="hive")
+    filters = [
+        (c, "==", v)
+        for c, v in (("season", season), ("season_type", season_type))
+        if v is not None and c in present
+    ]
+    return pd.read_parquet(
+        path, columns=columns, filters=filters or None, partitioning=partitioning
+    )
+
+
+def _conform(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """table with schema's columns and types (missing -> null); raises if a cast would lose data."""
+    columns = [
+        table.column(f.name).cast(f.type)
+        if f.name in table.column_names
+        else pa.nulls(len(table), f.type)
+        for f in schema
+    ]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _with_pandas_types(schema: pa.Schema, names: list[str]) -> pa.Schema:
+    """Update the stored pandas dtypes of names to (ArrowDtype of) their new Arrow types."""
+    meta = schema.pandas_metadata
+    if not meta:
+        return schema
+    fresh = pa.Schema.from_pandas(
+        pd.DataFrame({n: pd.Series([], dtype=pd.ArrowDtype(schema.field(n).type)) for n in names}),
+        preserve_index=False,
+    ).pandas_metadata
+    by_name = {c["name"]: c for c in fresh["columns"]}
+    meta["columns"] = [by_name.get(c["name"], c) for c in meta["columns"]]
+    return schema.with_metadata({**schema.metadata, b"pandas": json.dumps(meta).encode()})
+
+
+class StreamWriter:
+    """Append frames to one Parquet file as they arrive, holding none of them in memory.
+
+    The file schema comes from the first non-empty frame; later frames are aligned to
+    it (missing columns become null, extra columns are dropped). Response columns are
+    typed per response, so a later frame may not fit (5.5 or "R" after ints): the
+    conflicting columns are then widened (float64 or string) and the rows written so
+    far are rewritten to the widened file, one row group at a time.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.rows = 0
+        self._writer: pq.ParquetWriter | None = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        """Append one frame; empty frames are skipped."""
+        if df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if self._writer is None:
+            # All-null columns in the first frame would pin the column to the null type.
+            schema = pa.schema(
+                [f.with_type(pa.string()) if pa.types.is_null(f.type) else f for f in table.schema],
+                metadata=table.schema.metadata,
+            )
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(self.path, schema, compression="zstd")
+        try:
+            table = _conform(table, self._writer.schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            self._widen(table.schema)
+            table = _conform(table, self._writer.schema)
+        self._writer.write_table(table)
+        self.rows += len(df)
+
+    def _widen(self, incoming: pa.Schema) -> None:
+        """Reopen the file with columns widened to also fit incoming, keeping written rows."""
+        schema = self._writer.schema
+        changed = []
+        for i, f in enumerate(schema):
+            if f.name not in incoming.names or incoming.field(f.name).type == f.type:
+                continue
+            widened = utils.common_arrow_type(f.type, incoming.field(f.name).type)
+            if widened != f.type:
+                schema = schema.set(i, f.with_type(widened))
+                changed.append(f.name)
+        schema = _with_pandas_types(schema, changed)
+        log.info(
+            "  %s: widening %s",
+            self.path,
+            ", ".join(f"{n} to {schema.field(n).type}" for n in changed),
+        )
+        self._writer.close()
+        old = self.path.with_suffix(f".{os.getpid()}.tmp")
+        os.replace(self.path, old)
+        self._writer = pq.ParquetWriter(self.path, schema, compression="zstd")
+        for batch in pq.ParquetFile(old).iter_batches():
+            self._writer.write_table(_conform(pa.Table.from_batches([batch]), schema))
+        old.unlink()
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        log.info("  wrote %s: %d rows", self.path, self.rows)
+
+    def __enter__(self) -> StreamWriter:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
+from collections.abc import Iterable
+from datetime import date, datetime
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 log = logging.getLogger(__name__)
 
+_API_DATE = re.compile(r"\d{2}/\d{2}/\d{4}")
+_NON_WORD = re.compile(r"[^\w\s]")
+_WHITESPACE = re.compile(r"\s+")
+
 
 def to_snake_case(s: str) -> str:
     """Convert a string to snake_case (e.g. 'W/L%' -> 'w_l_pct').
@@ -19,22 +28,15 @@ def to_snake_case(s: str) -> str:
     Returns:
         str: Snake_case string.
     """
-    s = re.sub(r"[^\w\s]", " ", s)
-    s = re.sub(r"\s+", "_", s.strip()).lower()
+    s = _NON_WORD.sub(" ", s)
+    s = _WHITESPACE.sub("_", s.strip()).lower()
     return s or "unknown"
 
 
-def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Normalize DataFrame columns to snake_case; dedupe with _1, _2 suffix.
-
-    Args:
-        df (pd.DataFrame): DataFrame whose columns to normalize.
-
-    Returns:
-        pd.DataFrame: DataFrame with normalized column names.
-    """
-    df = df.copy()
-    base = [to_snake_case(str(c)) for c in df.columns]
+@functools.lru_cache(maxsize=1024)
+def _normalized_names(columns: tuple) -> tuple[str, ...]:
+    """Snake_case + deduped names for one header tuple (endpoint schemas repeat)."""
+    base = [to_snake_case(str(c)) for c in columns]
     seen: dict[str, int] = {}
     out: list[str] = []
     for name in base:
@@ -44,12 +46,165 @@ def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
         else:
             seen[name] = 0
             out.append(name)
-    df.columns = out
-    return df
+    return tuple(out)
+
+
+def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize DataFrame columns to snake_case; dedupe with _1, _2 suffix.
+
+    The mapping is cached per distinct header, so repeated responses from the same
+    endpoint skip the string processing.
+
+    Args:
+        df (pd.DataFrame): DataFrame whose columns to normalize.
+
+    Returns:
+        pd.DataFrame: DataFrame with normalized column names.
+    """
+    # set_axis returns a new frame over the same column data (Copy-on-Write)
+    return df.set_axis(list(_normalized_names(tuple(df.columns))), axis=1)
+
+
+# pandas < 3 copies every block on concat unless told not to; 3.x is Copy-on-Write
+# and deprecates the copy keyword. On 2.x, opt into the 3.x defaults too: Copy-on-Write,
+# so concat and column selection share blocks instead of copying them defensively, and
+# pyarrow-backed string inference instead of object columns of Python strings.
+_PANDAS_MAJOR = int(pd.__version__.split(".")[0])
+_CONCAT_NO_COPY = {"copy": False} if _PANDAS_MAJOR < 3 else {}
+if _PANDAS_MAJOR < 3:
+    pd.set_option("mode.copy_on_write", True)
+    pd.set_option("future.infer_string", True)
+
+
+def common_arrow_type(a: pa.DataType, b: pa.DataType) -> pa.DataType:
+    """Arrow type that values of both a and b fit in.
+
+    Response columns are typed per response, so the same column can come back int64
+    from one request and double or string from another.
+
+    Args:
+        a (pa.DataType): One column type.
+        b (pa.DataType): The other column type.
+
+    Returns:
+        pa.DataType: a when the types match or b is null (and vice versa); int64 for two
+            integer types, float64 for any other pair of numbers, else string.
+    """
+    if a == b or pa.types.is_null(b):
+        return a
+    if pa.types.is_null(a):
+        return b
+    if pa.types.is_integer(a) and pa.types.is_integer(b):
+        return pa.int64()
+    if (pa.types.is_integer(a) or pa.types.is_floating(a)) and (
+        pa.types.is_integer(b) or pa.types.is_floating(b)
+    ):
+        return pa.float64()
+    return pa.string()
+
+
+def _compact_arrow_chunks(df: pd.DataFrame) -> None:
+    """Merge the per-frame chunks concat leaves in pyarrow-backed columns, in place."""
+    for i, dtype in enumerate(df.dtypes):
+        if not isinstance(dtype, pd.ArrowDtype):
+            continue
+        chunked = df.iloc[:, i].array.__arrow_array__()
+        if chunked.num_chunks > 1:
+            df.isetitem(i, pd.arrays.ArrowExtensionArray(chunked.combine_chunks()))
+
+
+def _unify_arrow_types(parts: list[pd.DataFrame]) -> list[pd.DataFrame]:
+    """Cast pyarrow-backed columns typed differently across parts to common_arrow_type.
+
+    pd.concat would otherwise turn e.g. int64 in one frame and string in another into
+    an object column of mixed Python values, which DuckDB cannot register.
+    """
+    types: dict[str, set[pa.DataType]] = {}
+    for df in parts:
+        for col, dtype in df.dtypes.items():
+            if isinstance(dtype, pd.ArrowDtype):
+                types.setdefault(col, set()).add(dtype.pyarrow_dtype)
+    targets = {
+        col: functools.reduce(common_arrow_type, sorted(ts, key=str))
+        for col, ts in types.items()
+        if len(ts) > 1
+    }
+    if not targets:
+        return parts
+    out = []
+    for df in parts:
+        casts = {
+            col: target
+            for col, target in targets.items()
+            if col in df.columns
+            and isinstance(df.dtypes[col], pd.ArrowDtype)
+            and df.dtypes[col].pyarrow_dtype != target
+        }
+        if casts:
+            df = df.assign(
+                **{
+                    col: pd.arrays.ArrowExtensionArray(df[col].array.__arrow_array__().cast(target))
+                    for col, target in casts.items()
+                }
+            )
+        out.append(df)
+    return out
+
+
+def concat_frames(frames: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate non-empty frames in a single pass, without copying blocks.
+
+    Each frame is consolidated first (normalize/tag assignment leaves one block per
+    added column), so concat sees a handful of blocks per frame instead of many, and
+    the result is consolidated once so downstream .values / Arrow conversion is cheap.
+    pyarrow-backed columns come out of concat as one chunk per input frame (hundreds
+    for 1-row responses); they are compacted to one contiguous array each, which makes
+    later scans (DuckDB register, Parquet writes, string ops) an order of magnitude faster.
+    Columns typed per response are unified first (common_arrow_type), so a column that
+    is int64 in one frame and string in another comes out as one string column.
+
+    Args:
+        frames (Iterable[pd.DataFrame]): Partial frames (e.g. one per API response).
+
+    Returns:
+        pd.DataFrame: Frames stacked with a fresh RangeIndex; empty if none had rows.
+    """
+    parts = [df for df in frames if not df.empty]
+    if not parts:
+        return pd.DataFrame()
+    if len(parts) > 1:
+        parts = _unify_arrow_types(parts)
+    for df in parts:
+        df._consolidate_inplace()
+    out = pd.concat(parts, ignore_index=True, sort=False, **_CONCAT_NO_COPY)
+    if len(parts) > 1:
+        _compact_arrow_chunks(out)
+    out._consolidate_inplace()
+    return out
 
 
+def tag_columns(df: pd.DataFrame, **tags: str) -> pd.DataFrame:
+    """Add constant tag columns (season, season_type, ...) as single-category categoricals.
+
+    A one-value categorical costs one byte per row plus a one-entry dictionary, instead
+    of an object pointer per row; frames tagged with the same value concat as categorical.
+
+    Args:
+        df (pd.DataFrame): Frame to tag.
+        **tags (str): Column name -> constant value.
+
+    Returns:
+        pd.DataFrame: df with the tag columns set (overwriting same-named columns).
+    """
+    codes = np.zeros(len(df), dtype=np.int8)
+    return df.assign(
+        **{col: pd.Categorical.from_codes(codes, categories=[value]) for col, value in tags.items()}
+    )
+
+
+@functools.lru_cache(maxsize=256)
 def season_to_label(season: str) -> str:
-    """Convert season year to NBA API label (e.g. 2026 -> 2025-26).
+    """Convert season year to NBA API label (e.g. 2026 -> 2025-26); memoized per input.
 
     Args:
         season (str): Season year (e.g. 2026 for 2025-26).
@@ -61,6 +216,83 @@ def season_to_label(season: str) -> str:
     return f"{y - 1}-{str(y)[-2:]}"
 
 
+def unique_str_ids(s: pd.Series) -> list[str]:
+    """Distinct, stripped, non-null string IDs (e.g. game_id) in first-seen order.
+
+    Dedup runs first on the raw column (one hash pass, no per-row conversion), so only
+    the distinct values (e.g. ~1.2k games out of 100k log rows) are converted and stripped.
+    Order is kept so a limit takes the first IDs the API listed (e.g. most recent games).
+
+    Args:
+        s (pd.Series): ID column.
+
+    Returns:
+        list[str]: Unique IDs.
+    """
+    return list(dict.fromkeys(str(v).strip() for v in pd.unique(s.dropna())))
+
+
+def unique_int_ids(s: pd.Series) -> list[int]:
+    """Distinct non-null integer IDs (e.g. person_id, team_id) in first-seen order.
+
+    Args:
+        s (pd.Series): ID column.
+
+    Returns:
+        list[int]: Unique IDs.
+    """
+    return pd.unique(s.dropna().to_numpy(dtype=np.int64)).tolist()
+
+
+@functools.lru_cache(maxsize=4096)
+def game_date_for_api(d: str) -> str:
+    """Convert a game date to NBA API format (MM/DD/YYYY); memoized per input.
+
+    Dates already in API format pass through; ISO dates (e.g. 2024-01-15 or
+    2024-01-15T00:00:00) take the datetime fast path; anything else falls back to
+    pd.to_datetime.
+
+    Args:
+        d (str): Date string in any parseable format.
+
+    Returns:
+        str: Date as MM/DD/YYYY, or the input unchanged if it cannot be parsed.
+    """
+    if _API_DATE.fullmatch(d):
+        return d
+    try:
+        return datetime.fromisoformat(d[:10]).strftime("%m/%d/%Y")
+    except ValueError:
+        pass
+    try:
+        return pd.to_datetime(d).strftime("%m/%d/%Y")
+    except Exception:
+        return str(d)
+
+
+def game_dates_for_api(dates: Iterable[object]) -> dict[str, str]:
+    """Convert many game dates to NBA API format (MM/DD/YYYY) in one vectorized pass.
+
+    Args:
+        dates (Iterable[object]): Game dates (e.g. a game_date column).
+
+    Returns:
+        dict[str, str]: str(date) -> MM/DD/YYYY for each distinct date, in first-seen
+            order; dates pandas cannot parse go through game_date_for_api.
+    """
+    keys = list(dict.fromkeys(str(d) for d in dates))
+    if not keys:
+        return {}
+    # Game logs carry ISO dates; an explicit format skips per-call format inference, and
+    # anything else (e.g. dates already MM/DD/YYYY) comes back NaT for the scalar path
+    parsed = pd.to_datetime(pd.Series(keys, dtype=object), errors="coerce", format="ISO8601")
+    formatted = parsed.dt.strftime("%m/%d/%Y")
+    return {
+        k: v if isinstance(v, str) else game_date_for_api(k)
+        for k, v in zip(keys, formatted, strict=True)
+    }
+
+
 def align_df_to_existing_columns(df: pd.DataFrame, existing_cols: list[str]) -> pd.DataFrame:
     """Align incoming DataFrame to existing table columns (add NULLs, drop extras).
 
@@ -69,16 +301,29 @@ def align_df_to_existing_columns(df: pd.DataFrame, existing_cols: list[str]) ->
         existing_cols (list[str]): Column names of the existing table.
 
     Returns:
-        pd.DataFrame: DataFrame with only existing_cols, missing cols as NULL.
+        pd.DataFrame: DataFrame with only existing_cols, missing cols as NULL (NaN).
+    """
+    extra = df.columns.difference(existing_cols, sort=False)
+    if len(extra):
+        log.warning(
+            "Dropping %d new/unexpected columns: %s", len(extra), ", ".join(map(str, extra))
+        )
+    # One reindex instead of a column insert per missing name; the all-NaN float
+    # columns it adds load into DuckDB as NULL whatever the column type
+    return df.reindex(columns=existing_cols)
+
+
+def season_is_complete(season: str, today: date | None = None) -> bool:
+    """True once a season (playoffs included) is over, i.e. from July 1 of its year.
+
+    Args:
+        season (str): Season year (e.g. 2026 for 2025-26).
+        today (date | None, optional): Reference date. Defaults to date.today().
+
+    Returns:
+        bool: Whether the season's data can no longer change.
     """
-    out = df.copy()
-    for c in existing_cols:
-        if c not in out.columns:
-            out[c] = None
-    extra = [c for c in out.columns if c not in existing_cols]
-    if extra:
-        log.warning("Dropping %d new/unexpected columns: %s", len(extra), ", ".join(extra))
-    return out[existing_cols]
+    return (today or date.today()) >= date(int(season), 7, 1)
 
 
 def resolve_seasons(
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import logging
+import os
+import weakref
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from typing import Literal
 
@@ -17,6 +20,43 @@ log = logging.getLogger(__name__)
 BRONZE_SOURCES = ("nba", "ncaa")
 Source = Literal["nba", "ncaa"]
 
+# Optional DuckDB settings for the bronze connection; unset ones keep DuckDB's defaults
+# (all cores, 80% of RAM, spill next to the database file). preserve_insertion_order
+# stays on: the SORT_KEYS layout and play-by-play event order rely on it.
+DUCKDB_CONFIG = {
+    key: value
+    for key, value in {
+        "threads": os.getenv("NBA_DUCKDB_THREADS"),
+        "memory_limit": os.getenv("NBA_DUCKDB_MEMORY_LIMIT"),
+        "temp_directory": os.getenv("NBA_DUCKDB_TEMP_DIR"),
+    }.items()
+    if value
+}
+
+# Rows are written sorted by these columns (those present) so each row group covers a
+# narrow game/team/player range and DuckDB's min/max zonemaps can skip the rest.
+# The sort is stable, so play-by-play keeps its event order within a game.
+SORT_KEYS: dict[str, tuple[str, ...]] = {
+    "team_game_logs": ("game_id", "team_id"),
+    "player_game_logs": ("game_id", "team_id", "player_id"),
+    "common_all_players": ("person_id",),
+    "team_rosters": ("team_id", "player_id"),
+    "schedule": ("game_id",),
+    "box_summaries": ("game_id",),
+    "box_advanced": ("game_id", "team_id", "player_id"),
+    "box_traditional": ("game_id", "team_id", "player_id"),
+    "playbyplay": ("game_id",),
+    "shot_charts": ("game_id",),
+    "player_info": ("person_id",),
+    "player_box_scores": ("contest_id",),
+}
+
+# Column names of the bronze tables already looked up (or created) per connection, so a
+# multi-season backfill does not re-probe the catalog for every table of every season
+_TABLE_COLUMNS: weakref.WeakKeyDictionary[duckdb.DuckDBPyConnection, dict[str, list[str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def _bronze_path(db_path: str) -> Path:
     """Path to the bronze database file (raw data by source)."""
@@ -59,7 +99,7 @@ def init_duckdb(db_path: str) -> duckdb.DuckDBPyConnection:
     path = _bronze_path(db_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     log.info("Opening bronze DuckDB: %s", path)
-    con = duckdb.connect(str(path))
+    con = duckdb.connect(str(path), config=DUCKDB_CONFIG)
     for schema in BRONZE_SOURCES:
         con.execute(f"CREATE SCHEMA IF NOT EXISTS {schema}")
     # Ensure silver and gold DB files exist (empty) so all three DBs are present
@@ -86,13 +126,45 @@ def table_exists(con: duckdb.DuckDBPyConnection, schema: str, table: str) -> boo
     return cnt > 0
 
 
+def _table_columns(con: duckdb.DuckDBPyConnection, schema: str, table: str) -> list[str] | None:
+    """Column names of schema.table (None when missing), looked up once per connection."""
+    known = _TABLE_COLUMNS.setdefault(con, {})
+    fq_table = f"{schema}.{table}"
+    if fq_table not in known:
+        if not table_exists(con, schema, table):
+            return None
+        known[fq_table] = [row[0] for row in con.execute(f"DESCRIBE {fq_table}").fetchall()]
+    return known[fq_table]
+
+
+def _without_categoricals(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast categorical columns back to their values' dtype before handing df to DuckDB.
+
+    DuckDB registers a pandas categorical as an ENUM of the categories present, so a
+    table created from one season would reject the next season's tag values.
+    """
+    cats = [c for c, dtype in df.dtypes.items() if isinstance(dtype, pd.CategoricalDtype)]
+    if not cats:
+        return df
+    return df.astype({c: df[c].cat.categories.dtype for c in cats})
+
+
+def _sorted_by(df: pd.DataFrame, keys: Sequence[str]) -> pd.DataFrame:
+    """Stable-sort df by the key columns it has (unchanged when it has none)."""
+    present = [k for k in keys if k in df.columns]
+    if not present:
+        return df
+    return df.sort_values(present, kind="mergesort", ignore_index=True)
+
+
 def upsert_bronze_table(
     con: duckdb.DuckDBPyConnection,
     source: Source,
     table_name: str,
     df: pd.DataFrame,
-    season: str,
+    season: str | Sequence[str],
     season_type: str | None = None,
+    sort_keys: Sequence[str] = (),
 ) -> None:
     """Create or upsert season-level rows in the bronze DB under schema nba or ncaa.
 
@@ -101,13 +173,15 @@ def upsert_bronze_table(
         source: 'nba' or 'ncaa'; data is written to schema nba or ncaa.
         table_name: Table name (e.g. team_game_logs, teams).
         df: Data to write.
-        season: Season year (e.g. 2026).
+        season: Season year (e.g. 2026), or every season year df holds rows for.
         season_type: NBA API season type (e.g. Regular Season). None for NCAA.
+        sort_keys: Columns to sort rows by before writing (missing ones are ignored).
     """
     if df.empty:
         log.debug("Skipping empty table: %s.%s", source, table_name)
         return
 
+    df = _sorted_by(_without_categoricals(df), sort_keys)
     fq_table = f"{source}.{table_name}"
     # ncaa.teams has no season; full replace each load
     if source == "ncaa" and table_name == "teams":
@@ -115,27 +189,33 @@ def upsert_bronze_table(
         con.execute(f"DROP TABLE IF EXISTS {fq_table}")
         con.execute(f"CREATE TABLE {fq_table} AS SELECT * FROM _df")
         con.unregister("_df")
+        _TABLE_COLUMNS.setdefault(con, {})[fq_table] = [str(c) for c in df.columns]
         log.info("  replaced %s: %d rows", fq_table, len(df))
         return
 
-    if not table_exists(con, source, table_name):
+    existing_cols = _table_columns(con, source, table_name)
+    if existing_cols is None:
         con.register("_df", df)
         con.execute(f"CREATE TABLE {fq_table} AS SELECT * FROM _df")
         con.unregister("_df")
+        _TABLE_COLUMNS.setdefault(con, {})[fq_table] = [str(c) for c in df.columns]
         log.info("  created %s: %d rows", fq_table, len(df))
         return
 
-    existing_cols = [row[0] for row in con.execute(f"DESCRIBE {fq_table}").fetchall()]
     aligned = utils.align_df_to_existing_columns(df, existing_cols)
     con.register("_df", aligned)
 
-    if "season" in existing_cols and "season_type" in existing_cols and season_type is not None:
-        con.execute(
-            f"DELETE FROM {fq_table} WHERE season = ? AND season_type = ?",
-            [season, season_type],
-        )
-    elif "season" in existing_cols:
-        con.execute(f"DELETE FROM {fq_table} WHERE season = ?", [season])
+    seasons = [season] if isinstance(season, str) else list(season)
+    where, params = None, []
+    if "season" in existing_cols:
+        where = f"season IN ({', '.join('?' * len(seasons))})"
+        params = list(seasons)
+        if "season_type" in existing_cols and season_type is not None:
+            where += " AND season_type = ?"
+            params.append(season_type)
+    # First load of a season (the usual backfill case): skip the DELETE's full scan
+    if where and con.execute(f"SELECT 1 FROM {fq_table} WHERE {where} LIMIT 1", params).fetchone():
+        con.execute(f"DELETE FROM {fq_table} WHERE {where}", params)
 
     cols_sql = ", ".join([f'"{c}"' for c in existing_cols])
     con.execute(f"INSERT INTO {fq_table} ({cols_sql}) SELECT {cols_sql} FROM _df")
@@ -161,5 +241,77 @@ def write_duckdb_for_season(
         season_type: NBA API season type. Pass None for NCAA.
     """
     log.info("Writing season=%s source=%s season_type=%s to bronze DuckDB", season, source, season_type)
-    for name, df in tables.items():
-        upsert_bronze_table(con, source, name, df, season=season, season_type=season_type)
+    _write_tables(con, tables, season, source=source, season_type=season_type)
+
+
+def write_duckdb_for_seasons(
+    con: duckdb.DuckDBPyConnection,
+    tables_by_season: Mapping[str, Mapping[str, pd.DataFrame]],
+    *,
+    source: Source,
+    season_type: str | None = None,
+) -> None:
+    """Write several seasons' raw tables with one DELETE and one INSERT per table.
+
+    Each table is concatenated across seasons first, so a backfill batch costs one
+    statement per table instead of one per table per season.
+
+    Args:
+        con: DuckDB connection (bronze.duckdb).
+        tables_by_season: Season year -> raw tables keyed by name, as for
+            write_duckdb_for_season.
+        source: 'nba' or 'ncaa'; data is written to that schema in the bronze DB.
+        season_type: NBA API season type. Pass None for NCAA.
+    """
+    if not tables_by_season:
+        return
+    seasons = list(tables_by_season)
+    log.info(
+        "Writing seasons=%s..%s (%d) source=%s season_type=%s to bronze DuckDB",
+        seasons[0],
+        seasons[-1],
+        len(seasons),
+        source,
+        season_type,
+    )
+    names = dict.fromkeys(name for tables in tables_by_season.values() for name in tables)
+    # Tags are cast per season first: categoricals with different categories would
+    # concat to object columns
+    tables = {
+        name: utils.concat_frames(
+            [_without_categoricals(t[name]) for t in tables_by_season.values() if name in t]
+        )
+        for name in names
+    }
+    _write_tables(con, tables, seasons, source=source, season_type=season_type)
+
+
+def _write_tables(
+    con: duckdb.DuckDBPyConnection,
+    tables: Mapping[str, pd.DataFrame],
+    season: str | Sequence[str],
+    *,
+    source: Source,
+    season_type: str | None,
+) -> None:
+    """Upsert tables for season(s) in one transaction, rolling back on any error."""
+    # One transaction: a single commit instead of one per statement, and a failed
+    # table leaves every table at its previous state for the season(s)
+    con.execute("BEGIN TRANSACTION")
+    try:
+        for name, df in tables.items():
+            upsert_bronze_table(
+                con,
+                source,
+                name,
+                df,
+                season=season,
+                season_type=season_type,
+                sort_keys=SORT_KEYS.get(name, ()),
+            )
+    except BaseException:
+        con.execute("ROLLBACK")
+        # Tables created in the rolled-back transaction no longer exist
+        _TABLE_COLUMNS.pop(con, None)
+        raise
+    con.execute("COMMIT")
@@ -9,9 +9,13 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import os
 import sys
+from pathlib import Path
+
+import duckdb
 
 from load.modules import aws, utils, warehouse
 from load.nba import fetch
@@ -19,6 +23,71 @@ from load.nba import fetch
 log = logging.getLogger(__name__)
 
 
+async def _load_seasons(
+    con: duckdb.DuckDBPyConnection, seasons: list[str], args: argparse.Namespace
+) -> None:
+    """Load every season inside one event loop, sharing one HTTP session.
+
+    With --season-batch N > 1, full loads are kept in memory and written N seasons at
+    a time (one statement per table) instead of after every fetch phase.
+    """
+    batch: dict[str, dict] = {}
+
+    def write_batch() -> None:
+        warehouse.write_duckdb_for_seasons(
+            con, batch, source="nba", season_type=args.season_type
+        )
+        batch.clear()
+
+    async with fetch.get_session() as session:
+        for i, season in enumerate(seasons, 1):
+            log.info("=== Season %s (%d/%d) ===", season, i, len(seasons))
+            if args.dataset is not None:
+                tables = await fetch.load_one_dataset_async(
+                    dataset=args.dataset,
+                    season=season,
+                    season_type=args.season_type,
+                    limit=args.limit,
+                    skip_lineups=args.skip_lineups,
+                    session=session,
+                    player_index=args.player_index,
+                )
+                warehouse.write_duckdb_for_season(
+                    con, tables, season=season, source="nba", season_type=args.season_type
+                )
+            elif args.season_batch > 1:
+                batch[season] = await fetch.load_all_raw_async(
+                    season=season,
+                    season_type=args.season_type,
+                    limit=args.limit,
+                    skip_lineups=args.skip_lineups,
+                    session=session,
+                    parquet_root=args.parquet_root,
+                    fetch_player_logs=args.player_logs,
+                    player_index=args.player_index,
+                )
+                if len(batch) >= args.season_batch:
+                    write_batch()
+            else:
+                def on_flush(tables: dict, season: str = season) -> None:
+                    warehouse.write_duckdb_for_season(
+                        con, tables, season=season, source="nba", season_type=args.season_type
+                    )
+                await fetch.load_all_raw_async(
+                    season=season,
+                    season_type=args.season_type,
+                    limit=args.limit,
+                    skip_lineups=args.skip_lineups,
+                    on_flush=on_flush,
+                    session=session,
+                    parquet_root=args.parquet_root,
+                    fetch_player_logs=args.player_logs,
+                    player_index=args.player_index,
+                )
+        if batch:
+            write_batch()
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="Load raw NBA data into DuckDB (+ optional S3)"
@@ -39,6 +108,31 @@ def main() -> int:
     parser.add_argument("--limit", type=int, default=None, metavar="N", help="Test mode: limit API calls")
     parser.add_argument("--skip-lineups", action="store_true", default=True, help="Skip lineup endpoints")
     parser.add_argument("--no-skip-lineups", action="store_false", dest="skip_lineups")
+    parser.add_argument(
+        "--parquet-root",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also write raw tables as season/season_type partitioned Parquet under DIR",
+    )
+    parser.add_argument(
+        "--no-player-logs",
+        action="store_false",
+        dest="player_logs",
+        help="Skip player game logs (team-only load)",
+    )
+    parser.add_argument(
+        "--player-index",
+        action="store_true",
+        help="Load player bios with one playerindex call (no birthdate) instead of one call per player",
+    )
+    parser.add_argument(
+        "--season-batch",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Backfill: write N seasons per DuckDB statement (held in memory until written)",
+    )
     parser.add_argument("--dataset", choices=fetch.DATASETS, default=None, metavar="NAME", help="Load only this dataset")
     args = parser.parse_args()
 
@@ -57,31 +151,7 @@ def main() -> int:
 
     con = warehouse.init_duckdb(args.db)
     try:
-        for i, season in enumerate(seasons, 1):
-            log.info("=== Season %s (%d/%d) ===", season, i, len(seasons))
-            if args.dataset is not None:
-                tables = fetch.load_one_dataset(
-                    dataset=args.dataset,
-                    season=season,
-                    season_type=args.season_type,
-                    limit=args.limit,
-                    skip_lineups=args.skip_lineups,
-                )
-                warehouse.write_duckdb_for_season(
-                    con, tables, season=season, source="nba", season_type=args.season_type
-                )
-            else:
-                def on_flush(tables: dict) -> None:
-                    warehouse.write_duckdb_for_season(
-                        con, tables, season=season, source="nba", season_type=args.season_type
-                    )
-                fetch.load_all_raw(
-                    season=season,
-                    season_type=args.season_type,
-                    limit=args.limit,
-                    skip_lineups=args.skip_lineups,
-                    on_flush=on_flush,
-                )
+        asyncio.run(_load_seasons(con, seasons, args))
     finally:
         con.close()
         log.info("DuckDB connection closed")
@@ -3,18 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
+import random
 import time
 from typing import Any
 from urllib.parse import urlencode
 
 import aiohttp
 import pandas as pd
+import pyarrow as pa
 import requests
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from requests.exceptions import Timeout as RequestsTimeout
 
+from load.modules import cache
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
+
 log = logging.getLogger(__name__)
 
 STATS_BASE_URL = "https://stats.nba.com/stats"
@@ -39,13 +49,71 @@ REQUEST_DELAY_SECONDS = float(os.getenv("NBA_API_REQUEST_DELAY_SECONDS", "1.5"))
 REQUEST_TIMEOUT_SECONDS = float(os.getenv("NBA_API_TIMEOUT_SECONDS", "60"))
 BACKOFF_INITIAL_SECONDS = float(os.getenv("NBA_API_BACKOFF_INITIAL_SECONDS", "30.0"))
 BACKOFF_MAX_SECONDS = float(os.getenv("NBA_API_BACKOFF_MAX_SECONDS", "300.0"))
+BACKOFF_JITTER_SECONDS = float(os.getenv("NBA_API_BACKOFF_JITTER_SECONDS", "5.0"))
+
+# Response bodies kept on disk (load.modules.cache) per endpoint, in seconds; endpoints
+# not listed always hit the API. Box summaries are only stored once the game is final.
+HISTORIC_CACHE_TTL_SECONDS = float(os.getenv("NBA_CACHE_HISTORIC_TTL_SECONDS", str(30 * 24 * 3600)))
+RESPONSE_CACHE_TTL_SECONDS = {
+    "leaguegamelog": cache.SHORT_TTL_SECONDS,
+    "commonplayerinfo": HISTORIC_CACHE_TTL_SECONDS,
+    "boxscoresummaryv2": HISTORIC_CACHE_TTL_SECONDS,
+}
+GAME_STATUS_FINAL = 3
 
 _SESSION = requests.Session()
 _SESSION.headers.update(STATS_HEADERS)
 
 
+def clear_session() -> None:
+    """Drop the pooled connections of the sync session; the next request reconnects.
+
+    Called before retrying a timeout or connection reset, so a half-closed keep-alive
+    socket is not reused for the retry.
+    """
+    _SESSION.close()
+
+
+def _loads(body: bytes) -> Any:
+    """Decode a JSON response body (orjson when installed)."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _cached_payload(endpoint: str, params: dict[str, str]) -> Any | None:
+    """Decoded cached response for endpoint + params, or None to call the API."""
+    ttl = RESPONSE_CACHE_TTL_SECONDS.get(endpoint)
+    if ttl is None:
+        return None
+    body = cache.read_body(endpoint, params, ttl)
+    if body is None:
+        return None
+    try:
+        payload = _loads(body)
+    except ValueError:
+        return None
+    log.debug("cache hit %s %s", endpoint, params)
+    return payload
+
+
+def _cache_payload(endpoint: str, params: dict[str, str], body: bytes, payload: Any) -> None:
+    """Store a validated response body if its endpoint is cached (see RESPONSE_CACHE_TTL_SECONDS)."""
+    if endpoint not in RESPONSE_CACHE_TTL_SECONDS:
+        return
+    if endpoint == "boxscoresummaryv2":
+        rs = select_resultset(payload, name="GameSummary", index=0) or {}
+        headers, rows = rs.get("headers", []), rs.get("rowSet") or []
+        if "GAME_STATUS_ID" not in headers or not rows:
+            return
+        if rows[0][headers.index("GAME_STATUS_ID")] != GAME_STATUS_FINAL:
+            return
+    cache.write_body(endpoint, params, body)
+
+
 def _retry_wait_seconds(attempt: int, resp: requests.Response | Any = None) -> float:
-    """Compute retry wait time (exponential backoff, optional Retry-After header).
+    """Compute retry wait time (exponential backoff + jitter, optional Retry-After header).
+
+    Jitter spreads out retries from concurrent workers that were throttled together,
+    so they do not all hit the server again at the same instant.
 
     Args:
         attempt (int): Current attempt index (0-based).
@@ -55,6 +123,7 @@ def _retry_wait_seconds(attempt: int, resp: requests.Response | Any = None) -> f
         float: Seconds to wait before retry.
     """
     backoff = min(BACKOFF_INITIAL_SECONDS * (2**attempt), BACKOFF_MAX_SECONDS)
+    backoff += random.uniform(0, BACKOFF_JITTER_SECONDS)
     if resp is not None:
         retry_after = resp.headers.get("Retry-After")
         if retry_after:
@@ -75,6 +144,9 @@ def call_stats_api(endpoint: str, params: dict[str, str]) -> dict:
     Returns:
         dict: JSON response body.
     """
+    payload = _cached_payload(endpoint, params)
+    if payload is not None:
+        return payload
     url = f"{STATS_BASE_URL}/{endpoint}"
     time.sleep(REQUEST_DELAY_SECONDS)
     for attempt in range(MAX_RETRIES + 1):
@@ -93,6 +165,7 @@ def call_stats_api(endpoint: str, params: dict[str, str]) -> dict:
                     wait,
                     full_url,
                 )
+                clear_session()
                 time.sleep(wait)
                 continue
             raise
@@ -109,7 +182,18 @@ def call_stats_api(endpoint: str, params: dict[str, str]) -> dict:
                 continue
             resp.raise_for_status()
         resp.raise_for_status()
-        return resp.json()
+        try:
+            payload = _loads(resp.content)
+        except ValueError:
+            # Throttled requests sometimes get a 200 with an HTML/empty body
+            if attempt < MAX_RETRIES:
+                wait = _retry_wait_seconds(attempt)
+                log.warning("invalid JSON endpoint=%s retrying in %.1fs", endpoint, wait)
+                time.sleep(wait)
+                continue
+            raise
+        _cache_payload(endpoint, params, resp.content, payload)
+        return payload
     raise RuntimeError(f"Failed to fetch endpoint={endpoint}")
 
 
@@ -130,6 +214,9 @@ async def call_stats_api_async(
     Returns:
         dict: JSON response body.
     """
+    payload = _cached_payload(endpoint, params)
+    if payload is not None:
+        return payload
     url = f"{STATS_BASE_URL}/{endpoint}"
     timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
 
@@ -152,8 +239,23 @@ async def call_stats_api_async(
                             continue
                         resp.raise_for_status()
                     resp.raise_for_status()
-                    return await resp.json()
+                    body = await resp.read()
+                try:
+                    payload = _loads(body)
+                except ValueError:
+                    # Throttled requests sometimes get a 200 with an HTML/empty body
+                    if attempt < MAX_RETRIES:
+                        wait = _retry_wait_seconds(attempt)
+                        log.warning("invalid JSON endpoint=%s retrying in %.1fs", endpoint, wait)
+                        await asyncio.sleep(wait)
+                        continue
+                    raise
+                _cache_payload(endpoint, params, body, payload)
+                return payload
             except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+                # Retryable statuses (429/5xx) were handled above; other 4xx won't recover
+                if isinstance(e, aiohttp.ClientResponseError) and e.status >= 400:
+                    raise
                 if attempt < MAX_RETRIES:
                     wait = _retry_wait_seconds(attempt)
                     kind = "timeout" if isinstance(e, asyncio.TimeoutError) else "connection reset"
@@ -171,32 +273,86 @@ async def call_stats_api_async(
     raise RuntimeError(f"Failed to fetch endpoint={endpoint}")
 
 
-def resultset_to_df(payload: dict, name: str | None = None, index: int = 0) -> pd.DataFrame:
-    """Parse NBA stats API resultSet(s) JSON into a DataFrame.
+def _column_array(values: tuple) -> pa.Array:
+    """Arrow array for one rowSet column; a column mixing types Arrow cannot unify
+    (e.g. numbers and strings) is kept as strings, with nulls preserved.
+
+    This only sees one response. A column typed differently across responses (int64
+    for one team, string for another) is unified where the frames are combined, in
+    utils.concat_frames.
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array([None if v is None else str(v) for v in values], type=pa.string())
+
+
+def _rows_to_df(rows: list[list], headers: list[str]) -> pd.DataFrame:
+    """Build a DataFrame from a rowSet column-wise through Arrow.
+
+    Columns become pyarrow-backed (no per-cell boxing into object blocks) and to_pandas
+    splits them into one block each instead of one large consolidated allocation.
+    Types are inferred per response; combine frames with utils.concat_frames.
+    """
+    if not rows:
+        return pd.DataFrame(rows, columns=headers)
+    table = pa.Table.from_arrays(
+        [_column_array(col) for col in zip(*rows, strict=True)], names=list(headers)
+    )
+    return table.to_pandas(split_blocks=True, self_destruct=True, types_mapper=pd.ArrowDtype)
+
+
+def select_resultset(payload: dict, name: str | None = None, index: int = 0) -> dict | None:
+    """Pick the result set resultset_to_df would parse.
 
     Args:
         payload (dict): API response JSON.
         name (str | None, optional): Result set name to select. Defaults to None.
-        index (int, optional): Index of result set when name not used. Defaults to 0.
+        index (int, optional): Index of result set (see resultset_to_df). Defaults to 0.
 
     Returns:
-        pd.DataFrame: Parsed table; empty if no matching result set.
+        dict | None: Result set with headers and rowSet; None if absent.
     """
     if "resultSets" in payload:
         sets = payload["resultSets"]
         if isinstance(sets, dict):
-            headers = sets.get("headers", [])
-            rows = sets.get("rowSet", [])
-            return pd.DataFrame(rows, columns=headers)
-        if name is not None:
+            return sets
+        if name is not None and not (index < len(sets) and sets[index].get("name") == name):
             for rs in sets:
                 if rs.get("name") == name:
-                    return pd.DataFrame(rs.get("rowSet", []), columns=rs.get("headers", []))
-        rs = sets[index]
-        return pd.DataFrame(rs.get("rowSet", []), columns=rs.get("headers", []))
+                    return rs
+        return sets[index]
+    return payload.get("resultSet")
+
 
-    if "resultSet" in payload:
-        rs = payload["resultSet"]
-        return pd.DataFrame(rs.get("rowSet", []), columns=rs.get("headers", []))
+def has_rows(payload: dict, name: str | None = None, index: int = 0) -> bool:
+    """True if the selected result set has any rows; lets callers skip building a frame.
 
-    return pd.DataFrame()
+    Args:
+        payload (dict): API response JSON.
+        name (str | None, optional): Result set name to select. Defaults to None.
+        index (int, optional): Index of result set (see resultset_to_df). Defaults to 0.
+
+    Returns:
+        bool: Whether resultset_to_df would return a non-empty DataFrame.
+    """
+    rs = select_resultset(payload, name=name, index=index)
+    return bool(rs and rs.get("rowSet"))
+
+
+def resultset_to_df(payload: dict, name: str | None = None, index: int = 0) -> pd.DataFrame:
+    """Parse NBA stats API resultSet(s) JSON into a DataFrame.
+
+    Args:
+        payload (dict): API response JSON.
+        name (str | None, optional): Result set name to select. Defaults to None.
+        index (int, optional): Index of result set. With name, the set at this index is
+            checked first so a known position skips the scan by name. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Parsed table; empty if no matching result set.
+    """
+    rs = select_resultset(payload, name=name, index=index)
+    if rs is None:
+        return pd.DataFrame()
+    return _rows_to_df(rs.get("rowSet", []), rs.get("headers", []))
@@ -3,13 +3,27 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Mapping
+from contextlib import AbstractContextManager, AsyncExitStack, asynccontextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import date
+from pathlib import Path
+from typing import Any, TypeVar
 
 import aiohttp
+import numpy as np
 import pandas as pd
 
-from load.modules import utils
+try:
+    import uvloop
+except ImportError:  # optional; stdlib asyncio loop is used instead
+    uvloop = None
+else:
+    uvloop.install()
+
+from load.modules import cache, parquet, utils
 from load.nba import api
 from load.nba.models import (
     BoxScoreParams,
@@ -24,78 +38,187 @@ from load.nba.models import (
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
 
-def _game_date_for_api(d: str) -> str:
-    """Convert game_date to NBA API format (MM/DD/YYYY)."""
-    try:
-        dt = pd.to_datetime(d)
-        return dt.strftime("%m/%d/%Y")
-    except Exception:
-        return str(d)
 
+_SESSION: ContextVar[aiohttp.ClientSession | None] = ContextVar("nba_session", default=None)
+_SEMAPHORE: ContextVar[asyncio.Semaphore | None] = ContextVar("nba_semaphore", default=None)
+# Endpoints of requests that failed during the current load_all_raw (see _call)
+_FAILED_CALLS: ContextVar[list[str] | None] = ContextVar("nba_failed_calls", default=None)
 
-def load_team_game_logs(season: str, season_type: str = "Regular Season") -> pd.DataFrame:
-    """Load team game logs from stats.nba.com API.
+
+def client_session() -> aiohttp.ClientSession:
+    """Build a keep-alive aiohttp session with the stats.nba.com headers.
+
+    The connector pools connections per host and caches DNS, so every request made
+    through one session reuses the same TCP/TLS connections.
+    """
+    headers = {**api.STATS_HEADERS}
+    headers["Connection"] = "keep-alive"
+    # Cap sockets to stats.nba.com at the request concurrency (aiohttp defaults to 100)
+    connector = aiohttp.TCPConnector(
+        limit=api.CONCURRENT_REQUESTS,
+        limit_per_host=api.CONCURRENT_REQUESTS,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, headers=headers)
+
+
+@asynccontextmanager
+async def get_session(
+    session: aiohttp.ClientSession | None = None,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Make one HTTP session (and request semaphore) current for the enclosed loaders.
+
+    Nested calls reuse the session already current, so a backfill that opens one
+    get_session() block shares its connection pool across every load_* call.
 
     Args:
-        season (str): Season year (e.g. 2026 for 2025-26)
-        season_type (str, optional): NBA API season type. Defaults to "Regular Season".
+        session (aiohttp.ClientSession | None, optional): Session to use; when None the
+            current one is reused, or a new client_session() is opened for the block.
 
-    Returns:
-        pd.DataFrame: Team game logs DataFrame
+    Yields:
+        aiohttp.ClientSession: The shared session.
     """
+    current = _SESSION.get()
+    if current is not None and session in (None, current):
+        yield current
+        return
+    async with AsyncExitStack() as stack:
+        if session is None:
+            session = await stack.enter_async_context(client_session())
+        session_token = _SESSION.set(session)
+        semaphore_token = _SEMAPHORE.set(asyncio.Semaphore(api.CONCURRENT_REQUESTS))
+        try:
+            yield session
+        finally:
+            _SEMAPHORE.reset(semaphore_token)
+            _SESSION.reset(session_token)
+
+
+_LOOP: asyncio.AbstractEventLoop | None = None
+_LOOP_SESSION: aiohttp.ClientSession | None = None
+
+
+def _run(coro: Awaitable[T]) -> T:
+    """Run coro for a sync wrapper on one persistent event loop and HTTP session.
+
+    asyncio.run would build and tear down a loop (and connection pool) per call, so a
+    caller looping over seasons with the sync API would renegotiate TLS every time.
+    Both are closed at interpreter exit.
+    """
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_close_loop)
+
+    async def main() -> T:
+        global _LOOP_SESSION
+        if _LOOP_SESSION is None or _LOOP_SESSION.closed:
+            _LOOP_SESSION = client_session()
+        async with get_session(_LOOP_SESSION):
+            return await coro
+
+    return _LOOP.run_until_complete(main())
+
+
+def _close_loop() -> None:
+    """Close the persistent session and loop used by _run."""
+    global _LOOP, _LOOP_SESSION
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    if _LOOP_SESSION is not None and not _LOOP_SESSION.closed:
+        _LOOP.run_until_complete(_LOOP_SESSION.close())
+    _LOOP.run_until_complete(_LOOP.shutdown_asyncgens())
+    _LOOP.close()
+    _LOOP, _LOOP_SESSION = None, None
+
+
+async def _call(endpoint: str, params: dict[str, str]) -> dict:
+    """Call a stats endpoint on the shared session, bounded by the shared semaphore."""
+    async with get_session() as session:
+        try:
+            return await api.call_stats_api_async(session, _SEMAPHORE.get(), endpoint, params)
+        except Exception:
+            failed = _FAILED_CALLS.get()
+            if failed is not None:
+                failed.append(endpoint)
+            raise
+
+
+def _stream_writer(output_path: Path | None) -> AbstractContextManager[parquet.StreamWriter | None]:
+    """StreamWriter for output_path, or a no-op context yielding None when it is unset."""
+    return parquet.StreamWriter(output_path) if output_path is not None else nullcontext()
+
+
+async def load_team_game_logs_async(
+    season: str, season_type: str = "Regular Season"
+) -> pd.DataFrame:
+    """Async form of load_team_game_logs; uses the shared session (see get_session)."""
     season_label = utils.season_to_label(season)
     log.info("Loading team game logs season=%s (%s)", season_label, season_type)
     params = LeagueGameLogParams(season=season_label, season_type=season_type, player_or_team="T")
-    payload = api.call_stats_api(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict())
+    payload = await _call(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict())
     df = api.resultset_to_df(payload)
     if df.empty:
         log.warning("No team game logs returned")
         return df
     df = utils.normalize_columns(df)
-    df["season"] = season
-    df["season_label"] = season_label
-    df["season_type"] = season_type
+    df = utils.tag_columns(df, season=season, season_label=season_label, season_type=season_type)
     log.info("  team_game_logs: %d rows", len(df))
     return df
 
 
-def load_player_game_logs(season: str, season_type: str = "Regular Season") -> pd.DataFrame:
-    """Load player game logs from stats.nba.com API.
+def load_team_game_logs(season: str, season_type: str = "Regular Season") -> pd.DataFrame:
+    """Load team game logs from stats.nba.com API.
 
     Args:
-        season (str): Season year (e.g. 2026 for 2025-26).
+        season (str): Season year (e.g. 2026 for 2025-26)
         season_type (str, optional): NBA API season type. Defaults to "Regular Season".
 
     Returns:
-        pd.DataFrame: Player game logs DataFrame.
+        pd.DataFrame: Team game logs DataFrame
     """
+    return _run(load_team_game_logs_async(season, season_type))
+
+
+async def load_player_game_logs_async(
+    season: str, season_type: str = "Regular Season"
+) -> pd.DataFrame:
+    """Async form of load_player_game_logs; uses the shared session (see get_session)."""
     season_label = utils.season_to_label(season)
     log.info("Loading player game logs season=%s (%s)", season_label, season_type)
     params = LeagueGameLogParams(season=season_label, season_type=season_type, player_or_team="P")
-    payload = api.call_stats_api(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict())
+    payload = await _call(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict())
     df = api.resultset_to_df(payload)
     if df.empty:
         log.warning("No player game logs returned")
         return df
     df = utils.normalize_columns(df)
-    df["season"] = season
-    df["season_label"] = season_label
-    df["season_type"] = season_type
+    df = utils.tag_columns(df, season=season, season_label=season_label, season_type=season_type)
     log.info("  player_game_logs: %d rows", len(df))
     return df
 
 
-def load_team_rosters(season: str, team_game_logs: pd.DataFrame) -> pd.DataFrame:
-    """Load commonteamroster for each team id observed in team game logs.
+def load_player_game_logs(season: str, season_type: str = "Regular Season") -> pd.DataFrame:
+    """Load player game logs from stats.nba.com API.
 
     Args:
         season (str): Season year (e.g. 2026 for 2025-26).
-        team_game_logs (pd.DataFrame): Team game logs used to derive team IDs.
+        season_type (str, optional): NBA API season type. Defaults to "Regular Season".
 
     Returns:
-        pd.DataFrame: Roster rows (one per player-team-season); empty if no teams.
+        pd.DataFrame: Player game logs DataFrame.
     """
+    return _run(load_player_game_logs_async(season, season_type))
+
+
+async def load_team_rosters_async(
+    season: str, team_game_logs: pd.DataFrame, output_path: Path | None = None
+) -> pd.DataFrame:
+    """Async form of load_team_rosters; uses the shared session (see get_session)."""
     if team_game_logs.empty or "team_id" not in team_game_logs.columns:
         log.warning("Cannot load rosters: team_game_logs empty or missing team_id")
         return pd.DataFrame()
@@ -107,64 +230,132 @@ def load_team_rosters(season: str, team_game_logs: pd.DataFrame) -> pd.DataFrame
         .sort_values("team_abbreviation")
     )
 
-    frames: list[pd.DataFrame] = []
+    team_ids = teams["team_id"].to_numpy(dtype=np.int64)
+    abbrevs = teams["team_abbreviation"].astype(str).to_numpy(dtype=object)
+
     log.info("Loading rosters for %d teams", len(teams))
 
-    for i, row in enumerate(teams.itertuples(index=False), 1):
-        team_id = int(row.team_id)
-        team_abbrev = str(row.team_abbreviation)
-        params = CommonTeamRosterParams(season=season_label, team_id=str(team_id))
-        payload = api.call_stats_api(Endpoint.COMMON_TEAM_ROSTER.value, params.to_api_dict())
-        df = api.resultset_to_df(payload, name=ResultSet.COMMON_TEAM_ROSTER.value)
-        if df.empty:
-            log.warning("  %s (%s): empty roster", team_abbrev, team_id)
-            continue
-        df = utils.normalize_columns(df)
-        df["team_id"] = team_id
-        df["team_abbreviation"] = team_abbrev
-        df["season"] = season
-        df["season_label"] = season_label
-        frames.append(df)
-        log.info(
-            "  %s (%s): %d players (%d/%d)",
-            team_abbrev,
-            team_id,
-            len(df),
-            i,
-            len(teams),
+    def finish(df: pd.DataFrame) -> pd.DataFrame:
+        return utils.tag_columns(
+            utils.normalize_columns(df), season=season, season_label=season_label
         )
 
-    if not frames:
-        return pd.DataFrame()
-    out = pd.concat(frames, ignore_index=True)
+    with _stream_writer(output_path) as writer:
+
+        async def roster(i: int) -> pd.DataFrame:
+            team_id, team_abbrev = team_ids[i], abbrevs[i]
+            params = CommonTeamRosterParams(season=season_label, team_id=str(team_id))
+            payload = await _call(Endpoint.COMMON_TEAM_ROSTER.value, params.to_api_dict())
+            df = api.resultset_to_df(payload, name=ResultSet.COMMON_TEAM_ROSTER.value, index=0)
+            if df.empty:
+                log.warning("  %s (%s): empty roster", team_abbrev, team_id)
+                return df
+            df["team_id"] = team_id
+            df["team_abbreviation"] = team_abbrev
+            log.info("  %s (%s): %d players", team_abbrev, team_id, len(df))
+            # Streamed frames are written as they arrive; kept ones are finished once below
+            return finish(df) if writer is not None else df
+
+        frames = await _fetch_each(
+            "team_rosters", "teams", list(range(len(team_ids))), roster, writer=writer
+        )
+
+    out = utils.concat_frames(frames)
+    if out.empty:
+        return out
+    out = finish(out)
+    out["team_abbreviation"] = out["team_abbreviation"].astype("category")
     log.info("  team_rosters: %d rows", len(out))
     return out
 
 
-def load_common_all_players(season: str) -> pd.DataFrame:
-    """Load commonallplayers: master player list for a season.
+def load_team_rosters(
+    season: str, team_game_logs: pd.DataFrame, output_path: Path | None = None
+) -> pd.DataFrame:
+    """Load commonteamroster for each team id observed in team game logs.
 
     Args:
         season (str): Season year (e.g. 2026 for 2025-26).
+        team_game_logs (pd.DataFrame): Team game logs used to derive team IDs.
+        output_path (Path | None, optional): Stream each team's roster to this Parquet
+            file as it arrives instead of holding them all in memory; only rosters
+            that could not be written are then returned.
 
     Returns:
-        pd.DataFrame: One row per player active in the season.
+        pd.DataFrame: Roster rows (one per player-team-season); empty if no teams.
     """
+    return _run(load_team_rosters_async(season, team_game_logs, output_path))
+
+
+async def load_common_all_players_async(season: str) -> pd.DataFrame:
+    """Async form of load_common_all_players; uses the shared session (see get_session)."""
     season_label = utils.season_to_label(season)
     log.info("Loading commonallplayers season=%s", season_label)
     params = CommonAllPlayersParams(season=season_label)
-    payload = api.call_stats_api(Endpoint.COMMON_ALL_PLAYERS.value, params.to_api_dict())
-    df = api.resultset_to_df(payload, name=ResultSet.COMMON_ALL_PLAYERS.value)
+    payload = await _call(Endpoint.COMMON_ALL_PLAYERS.value, params.to_api_dict())
+    df = api.resultset_to_df(payload, name=ResultSet.COMMON_ALL_PLAYERS.value, index=0)
     if df.empty:
         log.warning("No commonallplayers returned")
         return df
     df = utils.normalize_columns(df)
-    df["season"] = season
-    df["season_label"] = season_label
+    df = utils.tag_columns(df, season=season, season_label=season_label)
     log.info("  common_all_players: %d rows", len(df))
     return df
 
 
+def load_common_all_players(season: str) -> pd.DataFrame:
+    """Load commonallplayers: master player list for a season.
+
+    Args:
+        season (str): Season year (e.g. 2026 for 2025-26).
+
+    Returns:
+        pd.DataFrame: One row per player active in the season.
+    """
+    return _run(load_common_all_players_async(season))
+
+
+def _before_today(value: object) -> bool:
+    """True if a date-like value (e.g. 2024-01-15, 2024-01-15T00:00:00) is in the past."""
+    try:
+        return pd.Timestamp(str(value)[:10]).date() < date.today()
+    except ValueError:
+        return False
+
+
+def _scoreboard_ttl(arguments: Mapping[str, Any], df: pd.DataFrame) -> float:
+    """Scoreboards for past dates are final; today's and future ones change."""
+    return cache.FOREVER if _before_today(arguments["game_date"]) else cache.SHORT_TTL_SECONDS
+
+
+def _box_score_summary_ttl(arguments: Mapping[str, Any], df: pd.DataFrame) -> float:
+    """Summaries of games played before today are final."""
+    if (
+        "game_date_est" in df.columns
+        and not df.empty
+        and _before_today(df["game_date_est"].iloc[0])
+    ):
+        return cache.FOREVER
+    return cache.SHORT_TTL_SECONDS
+
+
+@cache.cached(Endpoint.SCOREBOARD.value, ttl=_scoreboard_ttl)
+async def load_scoreboard_async(
+    game_date: str, season: str, season_type: str = "Regular Season"
+) -> pd.DataFrame:
+    """Async form of load_scoreboard; uses the shared session (see get_session)."""
+    api_date = utils.game_date_for_api(game_date)
+    params = ScoreboardParams(game_date=api_date)
+    payload = await _call(Endpoint.SCOREBOARD.value, params.to_api_dict())
+    df = api.resultset_to_df(payload, name=ResultSet.GAME_HEADER.value, index=0)
+    if df.empty:
+        return df
+    df = utils.normalize_columns(df)
+    df["game_date_api"] = api_date
+    df = utils.tag_columns(df, season=season, season_type=season_type)
+    return df
+
+
 def load_scoreboard(
     game_date: str, season: str, season_type: str = "Regular Season"
 ) -> pd.DataFrame:
@@ -178,17 +369,43 @@ def load_scoreboard(
     Returns:
         pd.DataFrame: One row per game (schedule metadata).
     """
-    api_date = _game_date_for_api(game_date)
-    params = ScoreboardParams(game_date=api_date)
-    payload = api.call_stats_api(Endpoint.SCOREBOARD.value, params.to_api_dict())
-    df = api.resultset_to_df(payload, name=ResultSet.GAME_HEADER.value)
-    if df.empty:
-        return df
-    df = utils.normalize_columns(df)
-    df["game_date_api"] = api_date
-    df["season"] = season
-    df["season_type"] = season_type
-    return df
+    return _run(load_scoreboard_async(game_date, season, season_type))
+
+
+async def load_schedule_async(
+    team_game_logs: pd.DataFrame,
+    season: str,
+    season_type: str = "Regular Season",
+) -> pd.DataFrame:
+    """Async form of load_schedule; uses the shared session (see get_session)."""
+    if team_game_logs.empty or "game_date" not in team_game_logs.columns:
+        log.warning("Cannot load schedule: team_game_logs empty or missing game_date")
+        return pd.DataFrame()
+
+    # One vectorized date conversion; scoreboards then get API-format dates directly
+    api_dates = utils.game_dates_for_api(sorted(team_game_logs["game_date"].dropna().unique()))
+    log.info("Loading schedule for %d unique dates", len(api_dates))
+
+    scoreboards = await _fetch_each(
+        "schedule",
+        "dates",
+        list(api_dates.values()),
+        lambda d: load_scoreboard_async(d, season=season, season_type=season_type),
+    )
+
+    # Keep each game once (first date wins) instead of deduping the concatenated table
+    frames: list[pd.DataFrame] = []
+    seen: set = set()
+    for df in scoreboards:
+        df = df[~df["game_id"].isin(seen)].drop_duplicates(subset=["game_id"])
+        seen.update(df["game_id"])
+        frames.append(df)
+
+    out = utils.concat_frames(frames)
+    if out.empty:
+        return out
+    log.info("  schedule: %d games", len(out))
+    return out
 
 
 def load_schedule(
@@ -206,26 +423,27 @@ def load_schedule(
     Returns:
         pd.DataFrame: One row per game (schedule metadata).
     """
-    if team_game_logs.empty or "game_date" not in team_game_logs.columns:
-        log.warning("Cannot load schedule: team_game_logs empty or missing game_date")
-        return pd.DataFrame()
+    return _run(load_schedule_async(team_game_logs, season, season_type))
 
-    dates = team_game_logs["game_date"].dropna().unique().tolist()
-    log.info("Loading schedule for %d unique dates", len(dates))
 
-    frames: list[pd.DataFrame] = []
-    for i, d in enumerate(sorted(dates), 1):
-        df = load_scoreboard(str(d), season=season, season_type=season_type)
-        if not df.empty:
-            frames.append(df)
-        if i % 30 == 0:
-            log.info("  schedule: %d/%d dates", i, len(dates))
-
-    if not frames:
-        return pd.DataFrame()
-    out = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["game_id"])
-    log.info("  schedule: %d games", len(out))
-    return out
+def _box_score_summary_df(payload: dict, season: str, season_type: str) -> pd.DataFrame:
+    """Parse a boxscoresummaryv2 payload into the tagged GameSummary frame."""
+    df = api.resultset_to_df(payload, name=ResultSet.GAME_SUMMARY.value, index=0)
+    if df.empty:
+        return df
+    df = utils.normalize_columns(df)
+    df = utils.tag_columns(df, season=season, season_type=season_type)
+    return df
+
+
+@cache.cached(Endpoint.BOX_SCORE_SUMMARY.value, ttl=_box_score_summary_ttl)
+async def load_box_score_summary_async(
+    game_id: str, season: str, season_type: str = "Regular Season"
+) -> pd.DataFrame:
+    """Async form of load_box_score_summary; uses the shared session (see get_session)."""
+    params = BoxScoreParams(game_id=str(game_id))
+    payload = await _call(Endpoint.BOX_SCORE_SUMMARY.value, params.to_api_dict())
+    return _box_score_summary_df(payload, season, season_type)
 
 
 def load_box_score_summary(
@@ -240,52 +458,157 @@ def load_box_score_summary(
     Returns:
         pd.DataFrame: One row with game summary (arena, officials, etc.).
     """
-    params = BoxScoreParams(game_id=str(game_id))
-    payload = api.call_stats_api(Endpoint.BOX_SCORE_SUMMARY.value, params.to_api_dict())
-    df = api.resultset_to_df(payload, name=ResultSet.GAME_SUMMARY.value)
-    if df.empty:
+    return _run(load_box_score_summary_async(game_id, season, season_type))
+
+
+async def _fetch_each(
+    label: str,
+    unit: str,
+    ids: list,
+    fetch_one: Callable[[Any], Awaitable[pd.DataFrame]],
+    writer: parquet.StreamWriter | None = None,
+) -> list[pd.DataFrame]:
+    """Run fetch_one for every id concurrently on the shared session, logging progress.
+
+    Each request already retries transient errors (see api.call_stats_api_async); an id
+    that still fails is logged with the others and skipped, rather than discarding
+    every frame fetched in the batch.
+
+    Args:
+        label (str): Name used in progress logs (e.g. box_summaries).
+        unit (str): What an id is, for progress logs (e.g. games).
+        ids (list): IDs to fetch.
+        fetch_one (Callable): async (id) -> pd.DataFrame.
+        writer (parquet.StreamWriter | None, optional): Write each frame as soon as it
+            arrives (completion order) instead of keeping it.
+
+    Returns:
+        list[pd.DataFrame]: Non-empty frames, in id order; when writer is set, only the
+            frames it could not write.
+    """
+    done = 0
+    unwritten = 0
+
+    async def worker(id_: Any) -> pd.DataFrame:
+        nonlocal done, unwritten
+        df = await fetch_one(id_)
+        done += 1
+        if done % 50 == 0:
+            log.info("  %s: %d/%d %s", label, done, len(ids), unit)
+        if writer is not None:
+            # A write error is not a failed request: keep the frame instead of dropping it
+            try:
+                writer.write(df)
+            except Exception as e:
+                unwritten += 1
+                log.debug("  %s %s not written to %s: %s", label, id_, writer.path, e)
+                return df
+            return pd.DataFrame()
         return df
-    df = utils.normalize_columns(df)
-    df["season"] = season
-    df["season_type"] = season_type
-    return df
+
+    async with get_session():
+        results = await asyncio.gather(*(worker(i) for i in ids), return_exceptions=True)
+    failed = [(i, r) for i, r in zip(ids, results, strict=True) if isinstance(r, Exception)]
+    for id_, err in failed:
+        log.debug("  %s %s failed: %s", label, id_, err)
+    if failed:
+        log.warning(
+            "  %s: %d/%d %s failed after retries (e.g. %s)",
+            label,
+            len(failed),
+            len(ids),
+            unit,
+            ", ".join(str(i) for i, _ in failed[:5]),
+        )
+    if unwritten:
+        log.warning(
+            "  %s: %d %s could not be written to %s; returning them instead",
+            label,
+            unwritten,
+            unit,
+            writer.path,
+        )
+    return [r for r in results if not isinstance(r, BaseException) and not r.empty]
+
+
+async def load_box_score_summaries_async(
+    team_game_logs: pd.DataFrame,
+    season: str,
+    season_type: str = "Regular Season",
+    output_path: Path | None = None,
+) -> pd.DataFrame:
+    """Async form of load_box_score_summaries; uses the shared session (see get_session)."""
+    if team_game_logs.empty or "game_id" not in team_game_logs.columns:
+        log.warning("Cannot load box summaries: team_game_logs empty or missing game_id")
+        return pd.DataFrame()
+
+    game_ids = utils.unique_str_ids(team_game_logs["game_id"])
+    log.info("Loading box score summaries for %d games", len(game_ids))
+
+    with _stream_writer(output_path) as writer:
+        frames = await _fetch_each(
+            "box_summaries",
+            "games",
+            game_ids,
+            lambda gid: load_box_score_summary_async(gid, season=season, season_type=season_type),
+            writer=writer,
+        )
+
+    out = utils.concat_frames(frames)
+    if out.empty:
+        return out
+    log.info("  box_summaries: %d rows", len(out))
+    return out
 
 
 def load_box_score_summaries(
     team_game_logs: pd.DataFrame,
     season: str,
     season_type: str = "Regular Season",
+    output_path: Path | None = None,
 ) -> pd.DataFrame:
     """Load box score summaries for all unique games in team_game_logs.
 
+    Requests are fanned out concurrently (bounded by api.CONCURRENT_REQUESTS) on one
+    keep-alive session.
+
     Args:
         team_game_logs (pd.DataFrame): Team game logs to derive game IDs.
         season (str): Season year.
         season_type (str): NBA API season type.
+        output_path (Path | None, optional): Stream each summary to this Parquet file as
+            it arrives instead of holding them all in memory; only summaries that could
+            not be written are then returned.
 
     Returns:
         pd.DataFrame: One row per game (arena, officials, attendance, etc.).
     """
-    if team_game_logs.empty or "game_id" not in team_game_logs.columns:
-        log.warning("Cannot load box summaries: team_game_logs empty or missing game_id")
-        return pd.DataFrame()
+    return _run(load_box_score_summaries_async(team_game_logs, season, season_type, output_path))
 
-    game_ids = team_game_logs["game_id"].dropna().astype(str).str.strip().unique().tolist()
-    log.info("Loading box score summaries for %d games", len(game_ids))
 
-    frames: list[pd.DataFrame] = []
-    for i, gid in enumerate(game_ids, 1):
-        df = load_box_score_summary(gid, season=season, season_type=season_type)
-        if not df.empty:
-            frames.append(df)
-        if i % 50 == 0:
-            log.info("  box_summaries: %d/%d games", i, len(game_ids))
-
-    if not frames:
-        return pd.DataFrame()
-    out = pd.concat(frames, ignore_index=True)
-    log.info("  box_summaries: %d rows", len(out))
-    return out
+def _common_player_info_df(payload: dict, season: str) -> pd.DataFrame:
+    """Parse a commonplayerinfo payload into the tagged player bio frame."""
+    df = api.resultset_to_df(payload, name=ResultSet.COMMON_PLAYER_INFO.value, index=0)
+    if df.empty:
+        return df
+    df = utils.normalize_columns(df)
+    df = utils.tag_columns(df, season=season)
+    return df
+
+
+def _common_player_info_ttl(arguments: Mapping[str, Any], df: pd.DataFrame) -> float:
+    """Bios from completed seasons are final; current-season bios (team, jersey, status) change."""
+    if not df.empty and utils.season_is_complete(arguments["season"]):
+        return cache.FOREVER
+    return cache.SHORT_TTL_SECONDS
+
+
+@cache.cached(Endpoint.COMMON_PLAYER_INFO.value, ttl=_common_player_info_ttl)
+async def load_common_player_info_async(player_id: int | str, season: str) -> pd.DataFrame:
+    """Async form of load_common_player_info; uses the shared session (see get_session)."""
+    params = CommonPlayerInfoParams(player_id=str(player_id))
+    payload = await _call(Endpoint.COMMON_PLAYER_INFO.value, params.to_api_dict())
+    return _common_player_info_df(payload, season)
 
 
 def load_common_player_info(player_id: int | str, season: str) -> pd.DataFrame:
@@ -298,93 +621,139 @@ def load_common_player_info(player_id: int | str, season: str) -> pd.DataFrame:
     Returns:
         pd.DataFrame: One row with player bio.
     """
-    params = CommonPlayerInfoParams(player_id=str(player_id))
-    payload = api.call_stats_api(Endpoint.COMMON_PLAYER_INFO.value, params.to_api_dict())
-    df = api.resultset_to_df(payload, name=ResultSet.COMMON_PLAYER_INFO.value)
-    if df.empty:
-        return df
-    df = utils.normalize_columns(df)
-    df["season"] = season
-    return df
+    return _run(load_common_player_info_async(player_id, season))
+
 
+async def load_player_info_async(
+    common_all_players: pd.DataFrame, season: str, output_path: Path | None = None
+) -> pd.DataFrame:
+    """Async form of load_player_info; uses the shared session (see get_session)."""
+    if common_all_players.empty or "person_id" not in common_all_players.columns:
+        log.warning("Cannot load player info: common_all_players empty or missing person_id")
+        return pd.DataFrame()
 
-def load_player_info(common_all_players: pd.DataFrame, season: str) -> pd.DataFrame:
+    player_ids = utils.unique_int_ids(common_all_players["person_id"])
+    log.info("Loading player info for %d players", len(player_ids))
+
+    with _stream_writer(output_path) as writer:
+        frames = await _fetch_each(
+            "player_info",
+            "players",
+            player_ids,
+            lambda pid: load_common_player_info_async(pid, season=season),
+            writer=writer,
+        )
+
+    out = utils.concat_frames(frames)
+    if out.empty:
+        return out
+    log.info("  player_info: %d rows", len(out))
+    return out
+
+
+def load_player_info(
+    common_all_players: pd.DataFrame, season: str, output_path: Path | None = None
+) -> pd.DataFrame:
     """Load commonplayerinfo for all players in common_all_players.
 
+    Requests are fanned out concurrently (bounded by api.CONCURRENT_REQUESTS) on one
+    keep-alive session.
+
     Args:
         common_all_players (pd.DataFrame): Output of load_common_all_players.
         season (str): Season year.
+        output_path (Path | None, optional): Stream each bio to this Parquet file as it
+            arrives instead of holding them all in memory; only bios that could not be
+            written are then returned.
 
     Returns:
         pd.DataFrame: One row per player (bio details).
     """
-    if common_all_players.empty or "person_id" not in common_all_players.columns:
-        log.warning("Cannot load player info: common_all_players empty or missing person_id")
-        return pd.DataFrame()
-
-    player_ids = common_all_players["person_id"].dropna().unique().tolist()
-    log.info("Loading player info for %d players", len(player_ids))
-
-    frames: list[pd.DataFrame] = []
-    for i, pid in enumerate(player_ids, 1):
-        df = load_common_player_info(pid, season=season)
-        if not df.empty:
-            frames.append(df)
-        if i % 50 == 0:
-            log.info("  player_info: %d/%d players", i, len(player_ids))
-
-    if not frames:
-        return pd.DataFrame()
-    out = pd.concat(frames, ignore_index=True)
-    log.info("  player_info: %d rows", len(out))
-    return out
+    return _run(load_player_info_async(common_all_players, season, output_path))
 
 
 async def _load_all_raw_async(
-    session: aiohttp.ClientSession,
-    semaphore: asyncio.Semaphore,
     season: str,
     season_type: str,
     limit: int | None = None,
     skip_lineups: bool = False,
     on_flush: Callable[[dict[str, pd.DataFrame]], None] | None = None,
+    fetch_player_logs: bool = True,
+    player_logs_checkpoint: pd.DataFrame | None = None,
+    player_index: bool = False,
 ) -> dict[str, pd.DataFrame]:
-    """Orchestrate fetch: call small fetchers in order, pass deps explicitly."""
+    """Orchestrate fetch: call small fetchers in order, pass deps explicitly.
+
+    Requests go through the current get_session() session and semaphore.
+
+    player_logs_checkpoint holds previously stored player logs for this season; only
+    games after its last game_date are fetched and the two are concatenated.
+    """
     from load.nba import fetchers
 
     season_label = utils.season_to_label(season)
+    date_from = None
+    if player_logs_checkpoint is not None and "game_date" in player_logs_checkpoint.columns:
+        last_date = pd.to_datetime(player_logs_checkpoint["game_date"]).max()
+        if pd.notna(last_date):
+            date_from = (last_date + pd.Timedelta(days=1)).strftime("%m/%d/%Y")
+            log.info(
+                "Player logs checkpoint through %s; fetching from %s", last_date.date(), date_from
+            )
     ctx = fetchers.FetchContext(
         season=season,
         season_label=season_label,
         season_type=season_type,
         limit=limit,
         skip_lineups=skip_lineups,
+        fetch_player_logs=fetch_player_logs,
+        player_logs_date_from=date_from,
+        player_index=player_index,
     )
 
-    async def one(endpoint: str, params: dict[str, str]) -> dict:
-        return await api.call_stats_api_async(session, semaphore, endpoint, params)
+    one = _call
 
     def to_df(payload: dict, name: str | None = None, index: int = 0) -> pd.DataFrame:
         return api.resultset_to_df(payload, name=name, index=index)
 
     log.info("Fetching raw NBA stats data for season=%s season_type=%s", season, season_type)
 
-    # Phase 1: core
-    team_logs, player_logs, common_players = await fetchers.fetch_core(one, to_df, ctx)
-    tables: dict[str, pd.DataFrame] = {
-        "team_game_logs": team_logs,
-        "player_game_logs": player_logs,
-        "common_all_players": common_players,
-    }
-    if on_flush:
-        on_flush(tables)
-
-    # Phase 2: rosters + schedule
-    rosters, schedule = await fetchers.fetch_rosters_schedule(one, to_df, ctx, team_logs)
-    tables["team_rosters"] = rosters
-    tables["schedule"] = schedule
-    if on_flush:
-        on_flush(tables)
+    # Phase 1: core. Rosters/schedule only depend on team logs, so Phase 2 starts as
+    # soon as they land while player logs and commonallplayers are still in flight.
+    log.info("Fetching team logs, player logs, commonallplayers (3 parallel)")
+    player_task = asyncio.create_task(fetchers.fetch_player_logs(one, to_df, ctx))
+    common_task = asyncio.create_task(fetchers.fetch_common_all_players(one, to_df, ctx))
+    tasks = [player_task, common_task]
+    try:
+        team_logs = await fetchers.fetch_team_logs(one, to_df, ctx)
+        rosters_task = asyncio.create_task(
+            fetchers.fetch_rosters_schedule(one, to_df, ctx, team_logs)
+        )
+        tasks.append(rosters_task)
+        player_logs, common_players = await asyncio.gather(player_task, common_task)
+        if date_from is not None:
+            player_logs = _with_checkpoint(player_logs_checkpoint, player_logs)
+        tables: dict[str, pd.DataFrame] = {
+            "team_game_logs": team_logs,
+            "player_game_logs": player_logs,
+            "common_all_players": common_players,
+        }
+        if on_flush:
+            on_flush(tables)
+
+        # Phase 2: rosters + schedule
+        rosters, schedule = await rosters_task
+        tables["team_rosters"] = rosters
+        tables["schedule"] = schedule
+        if on_flush:
+            on_flush(tables)
+    except BaseException:
+        # Don't leave the background fetches running (and their errors unretrieved)
+        # on a loop that outlives this call
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
 
     # Phase 2.5: reference
     ct, dh, cps = await fetchers.fetch_reference(one, to_df, ctx)
@@ -446,6 +815,13 @@ async def _load_all_raw_async(
     return tables
 
 
+def _with_checkpoint(checkpoint: pd.DataFrame, delta: pd.DataFrame) -> pd.DataFrame:
+    """Append newly fetched rows to checkpointed rows (aligned to the delta's columns)."""
+    if delta.empty:
+        return checkpoint
+    return utils.concat_frames([checkpoint.reindex(columns=delta.columns), delta])
+
+
 # --- Dataset registry and single-dataset loader ---
 
 DATASETS = [
@@ -469,15 +845,17 @@ DATASETS = [
 
 
 async def _load_one_dataset_async(
-    session: aiohttp.ClientSession,
-    semaphore: asyncio.Semaphore,
     dataset: str,
     season: str,
     season_type: str = "Regular Season",
     limit: int | None = None,
     skip_lineups: bool = False,
+    player_index: bool = False,
 ) -> dict[str, pd.DataFrame]:
-    """Load a single dataset. Fetches dependencies on-the-fly when required."""
+    """Load a single dataset. Fetches dependencies on-the-fly when required.
+
+    Requests go through the current get_session() session and semaphore.
+    """
     from load.nba import fetchers
 
     season_label = utils.season_to_label(season)
@@ -487,10 +865,10 @@ async def _load_one_dataset_async(
         season_type=season_type,
         limit=limit,
         skip_lineups=skip_lineups,
+        player_index=player_index,
     )
 
-    async def one(endpoint: str, params: dict[str, str]) -> dict:
-        return await api.call_stats_api_async(session, semaphore, endpoint, params)
+    one = _call
 
     def to_df(payload: dict, name: str | None = None, index: int = 0) -> pd.DataFrame:
         return api.resultset_to_df(payload, name=name, index=index)
@@ -595,12 +973,36 @@ async def _load_one_dataset_async(
     return await loader()
 
 
+async def load_one_dataset_async(
+    dataset: str,
+    season: str,
+    season_type: str = "Regular Season",
+    limit: int | None = None,
+    skip_lineups: bool = False,
+    session: aiohttp.ClientSession | None = None,
+    player_index: bool = False,
+) -> dict[str, pd.DataFrame]:
+    """Async form of load_one_dataset; reuses session when given."""
+    if dataset not in DATASETS:
+        raise ValueError(f"Unknown dataset: {dataset}. Valid: {DATASETS}")
+    async with get_session(session):
+        return await _load_one_dataset_async(
+            dataset,
+            season,
+            season_type=season_type,
+            limit=limit,
+            skip_lineups=skip_lineups,
+            player_index=player_index,
+        )
+
+
 def load_one_dataset(
     dataset: str,
     season: str,
     season_type: str = "Regular Season",
     limit: int | None = None,
     skip_lineups: bool = False,
+    player_index: bool = False,
 ) -> dict[str, pd.DataFrame]:
     """Load a single dataset from the NBA stats API.
 
@@ -610,29 +1012,108 @@ def load_one_dataset(
         season_type: NBA API season type.
         limit: Test mode: cap per-list API calls.
         skip_lineups: Skip lineup endpoints (used when dataset is a lineup type).
+        player_index: Build player_info from one playerindex call (no birthdate)
+            instead of one commonplayerinfo call per player.
 
     Returns:
         dict with one key (the dataset name) and its DataFrame.
     """
-    if dataset not in DATASETS:
-        raise ValueError(f"Unknown dataset: {dataset}. Valid: {DATASETS}")
-    semaphore = asyncio.Semaphore(api.CONCURRENT_REQUESTS)
-    headers = {**api.STATS_HEADERS}
-    headers["Connection"] = "keep-alive"
+    return _run(
+        load_one_dataset_async(
+            dataset,
+            season,
+            season_type=season_type,
+            limit=limit,
+            skip_lineups=skip_lineups,
+            player_index=player_index,
+        )
+    )
 
-    async def run() -> dict[str, pd.DataFrame]:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            return await _load_one_dataset_async(
-                session,
-                semaphore,
-                dataset,
-                season,
-                season_type=season_type,
-                limit=limit,
-                skip_lineups=skip_lineups,
-            )
 
-    return asyncio.run(run())
+async def load_all_raw_async(
+    season: str,
+    season_type: str = "Regular Season",
+    limit: int | None = None,
+    skip_lineups: bool = False,
+    on_flush: Callable[[dict[str, pd.DataFrame]], None] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    parquet_root: Path | None = None,
+    fetch_player_logs: bool = True,
+    player_index: bool = False,
+) -> dict[str, pd.DataFrame]:
+    """Async form of load_all_raw for callers that drive their own event loop.
+
+    Multi-season backfills should open one get_session() block (or pass one session)
+    for every season so the loop and connection pool are not rebuilt between seasons.
+
+    Args:
+        season (str): Season year (e.g. 2026 for 2025-26).
+        season_type (str, optional): NBA API season type. Defaults to "Regular Season".
+        limit (int | None, optional): Test mode: cap teams, dates, games, players per list.
+        skip_lineups (bool, optional): Skip lineup endpoints (often return 500).
+        on_flush (callable, optional): Called after each phase with accumulated tables.
+        session (aiohttp.ClientSession | None, optional): Shared session; when None the
+            current get_session() session is reused, or one is opened for this call.
+        parquet_root (Path | None, optional): When set, write each table to
+            parquet_root/<table> partitioned by season/season_type. Player logs already
+            stored there for this season are reused and only newer games are fetched.
+        fetch_player_logs (bool, optional): Skip the (large) player leaguegamelog call
+            when False; player_game_logs is then empty.
+        player_index (bool, optional): Build player_info from one playerindex call
+            (no birthdate) instead of one commonplayerinfo call per player.
+
+    Returns:
+        dict[str, pd.DataFrame]: Raw table DataFrames; empty DataFrames when
+            parquet_root is set (read back with parquet.read_partitioned).
+    """
+    # Completed seasons no longer change: serve every table from the disk cache
+    cache_key = {
+        "season": season,
+        "season_type": season_type,
+        "limit": limit,
+        "skip_lineups": skip_lineups,
+        "fetch_player_logs": fetch_player_logs,
+        "player_index": player_index,
+    }
+    complete = utils.season_is_complete(season)
+    tables = cache.read_tables("load_all_raw", cache_key) if complete else None
+    if tables is not None:
+        log.info("Using cached tables for completed season=%s season_type=%s", season, season_type)
+        if on_flush is not None:
+            on_flush(tables)
+    else:
+        checkpoint = None
+        if parquet_root is not None and fetch_player_logs:
+            checkpoint = parquet.read_partitioned(
+                parquet_root, "player_game_logs", season=season, season_type=season_type
+            )
+        failed_token = _FAILED_CALLS.set([])
+        try:
+            async with get_session(session):
+                tables = await _load_all_raw_async(
+                    season,
+                    season_type,
+                    limit=limit,
+                    skip_lineups=skip_lineups,
+                    on_flush=on_flush,
+                    fetch_player_logs=fetch_player_logs,
+                    player_logs_checkpoint=checkpoint,
+                    player_index=player_index,
+                )
+            failed = _FAILED_CALLS.get()
+        finally:
+            _FAILED_CALLS.reset(failed_token)
+        if complete and failed:
+            log.warning("Not caching season=%s: %d requests failed", season, len(failed))
+        elif complete:
+            cache.write_tables("load_all_raw", cache_key, tables)
+    if parquet_root is None:
+        return tables
+    log.info("Writing season=%s season_type=%s to parquet: %s", season, season_type, parquet_root)
+    for name in list(tables):
+        parquet.write_partitioned(tables[name], parquet_root, name)
+        tables[name] = pd.DataFrame()
+    return tables
 
 
 def load_all_raw(
@@ -641,12 +1122,19 @@ def load_all_raw(
     limit: int | None = None,
     skip_lineups: bool = False,
     on_flush: Callable[[dict[str, pd.DataFrame]], None] | None = None,
+    parquet_root: Path | None = None,
+    fetch_player_logs: bool = True,
+    player_index: bool = False,
 ) -> dict[str, pd.DataFrame]:
     """Fetch all raw tables from NBA stats API (async, 3 concurrent workers).
 
     Core: team logs, player logs, rosters.
     Dimensions: common_all_players, player_info, schedule, box_summaries.
 
+    Convenience wrapper around load_all_raw_async. It runs on the persistent loop and
+    session shared by every sync loader, so calling it once per season reuses
+    connections. Async callers can pass their own session to load_all_raw_async.
+
     Args:
         season (str): Season year (e.g. 2026 for 2025-26).
         season_type (str, optional): NBA API season type. Defaults to "Regular Season".
@@ -654,24 +1142,25 @@ def load_all_raw(
         skip_lineups (bool, optional): Skip lineup endpoints (often return 500).
         on_flush (callable, optional): Called after each phase with accumulated tables
             for incremental persistence (e.g. write to DuckDB after each API phase).
+        parquet_root (Path | None, optional): Write tables as partitioned Parquet under
+            this directory and return empty DataFrames instead of holding them.
+        fetch_player_logs (bool, optional): Set False for team-only consumers to skip
+            the player leaguegamelog call.
+        player_index (bool, optional): Build player_info from one playerindex call
+            (no birthdate) instead of one commonplayerinfo call per player.
 
     Returns:
         dict[str, pd.DataFrame]: Raw table DataFrames.
     """
-    semaphore = asyncio.Semaphore(api.CONCURRENT_REQUESTS)
-    headers = {**api.STATS_HEADERS}
-    headers["Connection"] = "keep-alive"
-
-    async def run() -> dict[str, pd.DataFrame]:
-        async with aiohttp.ClientSession(headers=headers) as session:
-            return await _load_all_raw_async(
-                session,
-                semaphore,
-                season,
-                season_type,
-                limit=limit,
-                skip_lineups=skip_lineups,
-                on_flush=on_flush,
-            )
-
-    return asyncio.run(run())
+    return _run(
+        load_all_raw_async(
+            season,
+            season_type=season_type,
+            limit=limit,
+            skip_lineups=skip_lineups,
+            on_flush=on_flush,
+            parquet_root=parquet_root,
+            fetch_player_logs=fetch_player_logs,
+            player_index=player_index,
+        )
+    )
@@ -1,7 +1,9 @@
 """Async fetchers: small, focused functions that each load one table or logical group.
 
 Each fetcher receives:
-  - one: (endpoint, params) -> Awaitable[dict]
+  - one: (endpoint, params) -> Awaitable[dict]; every call waits on the one request
+    semaphore of the current fetch.get_session(), so gathering thousands of requests
+    still keeps at most api.CONCURRENT_REQUESTS in flight
   - to_df: (payload, name?, index?) -> DataFrame
   - ctx: FetchContext
   - Optional DataFrames from earlier fetchers (dependencies)
@@ -12,11 +14,14 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass
-from typing import Any, Callable, Awaitable
+from typing import Any, Callable, Awaitable, TypeVar
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 from load.modules import utils
+from load.nba import api
 from load.nba.models import (
     BoxScoreParams,
     CommonAllPlayersParams,
@@ -29,6 +34,7 @@ from load.nba.models import (
     LeagueDashLineupsParams,
     LeagueGameLogParams,
     PlayByPlayParams,
+    PlayerIndexParams,
     ResultSet,
     ScoreboardParams,
     ShotChartParams,
@@ -37,16 +43,95 @@ from load.nba.models import (
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 OneFn = Callable[[str, dict[str, str]], Awaitable[dict]]
 ToDfFn = Callable[..., pd.DataFrame]
 
 
-def _game_date_for_api(d: str) -> str:
-    try:
-        dt = pd.to_datetime(d)
-        return dt.strftime("%m/%d/%Y")
-    except Exception:
-        return str(d)
+# Placeholder for per-request slots that had no rows (or failed). Only ever dropped by
+# _combine / utils.concat_frames, never returned, so sharing one instance is safe.
+_EMPTY_DF = pd.DataFrame()
+
+
+def _rows_df(to_df: ToDfFn, payload: dict, name: str | None = None, index: int = 0) -> pd.DataFrame:
+    """to_df for per-request fan-out; an empty rowSet skips frame construction entirely."""
+    if not api.has_rows(payload, name=name, index=index):
+        return _EMPTY_DF
+    return to_df(payload, name=name, index=index)
+
+
+def _combine(
+    frames: list[pd.DataFrame], per_frame: dict[str, list] | None = None, **tags: str
+) -> pd.DataFrame:
+    """Concat raw per-request frames and normalize their columns once.
+
+    per_frame maps a column to one value per frame (e.g. the team_id each roster was
+    requested for); values are repeated onto that frame's rows as Arrow-backed columns
+    after normalizing, so they overwrite any same-named API column as the per-frame
+    assignment used to.
+    tags are constant columns (season, season_type, ...) set on the whole result.
+    """
+    keep = [i for i, df in enumerate(frames) if not df.empty]
+    if not keep:
+        return pd.DataFrame()
+    out = utils.normalize_columns(utils.concat_frames(frames[i] for i in keep))
+    lengths = [len(frames[i]) for i in keep]
+    for col, values in (per_frame or {}).items():
+        # Arrow-backed like the API columns (see api._rows_to_df), not numpy str/object
+        repeated = np.repeat(np.array([values[i] for i in keep]), lengths)
+        out[col] = pd.arrays.ArrowExtensionArray(pa.array(repeated))
+    out = utils.tag_columns(out, **tags)
+    out._consolidate_inplace()
+    return out
+
+
+def _merge_payloads(payloads: list[dict], name: str | None = None, index: int = 0) -> list[dict]:
+    """Merge the selected result set of many responses into one payload per header layout.
+
+    Endpoints answering one row per request (boxscoresummaryv2, commonplayerinfo) then
+    cost one to_df call per table instead of one DataFrame per request.
+    """
+    merged: dict[tuple, dict] = {}
+    for p in payloads:
+        rs = api.select_resultset(p, name=name, index=index) if p else None
+        if not rs or not rs.get("rowSet"):
+            continue
+        headers = rs.get("headers", [])
+        slot = merged.setdefault(tuple(headers), {"resultSet": {"headers": headers, "rowSet": []}})
+        slot["resultSet"]["rowSet"].extend(rs["rowSet"])
+    return list(merged.values())
+
+
+async def _gather_results(label: str, coros: list[Awaitable[T]], keys: list, failed_value: T) -> list[T]:
+    """Gather per-request coroutines without failing fast.
+
+    Results keep their slot (aligned with keys); a request that raised becomes
+    failed_value, so one failure no longer discards the other responses.
+    """
+    results = await asyncio.gather(*coros, return_exceptions=True)
+    return _unwrap_results(label, keys, results, failed_value)
+
+
+def _unwrap_results(label: str, keys: list, results: list, failed_value: T) -> list[T]:
+    """Replace exceptions in gathered results with failed_value, logging how many failed."""
+    out: list[T] = []
+    failed = 0
+    for key, r in zip(keys, results, strict=True):
+        if isinstance(r, Exception):
+            failed += 1
+            log.debug("%s %s failed: %s", label, key, r)
+            out.append(failed_value)
+        else:
+            out.append(r)
+    if failed:
+        log.warning("%s: %d/%d requests failed", label, failed, len(keys))
+    return out
+
+
+async def _gather_frames(label: str, coros: list[Awaitable[pd.DataFrame]], keys: list) -> list[pd.DataFrame]:
+    """_gather_results for frame-returning requests; failed slots are empty DataFrames."""
+    return await _gather_results(label, coros, keys, _EMPTY_DF)
 
 
 @dataclass
@@ -56,39 +141,70 @@ class FetchContext:
     season_type: str
     limit: int | None
     skip_lineups: bool
+    fetch_player_logs: bool = True
+    player_logs_date_from: str | None = None  # MM/DD/YYYY; only fetch newer player logs
+    player_index: bool = False  # player_info from one playerindex call (no birthdate)
 
 
-async def fetch_core(
-    one: OneFn, to_df: ToDfFn, ctx: FetchContext
-) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Team logs, player logs, common_all_players."""
-    log.info("Fetching team logs, player logs, commonallplayers (3 parallel)")
-    team_params = LeagueGameLogParams(season=ctx.season_label, season_type=ctx.season_type, player_or_team="T")
-    player_params = LeagueGameLogParams(season=ctx.season_label, season_type=ctx.season_type, player_or_team="P")
-    common_params = CommonAllPlayersParams(season=ctx.season_label)
-    team_p, player_p, common_p = await asyncio.gather(
-        one(Endpoint.LEAGUE_GAME_LOG.value, team_params.to_api_dict()),
-        one(Endpoint.LEAGUE_GAME_LOG.value, player_params.to_api_dict()),
-        one(Endpoint.COMMON_ALL_PLAYERS.value, common_params.to_api_dict()),
-    )
-    team_logs = to_df(team_p)
+async def fetch_team_logs(one: OneFn, to_df: ToDfFn, ctx: FetchContext) -> pd.DataFrame:
+    """Team game logs (leaguegamelog, PlayerOrTeam=T)."""
+    params = LeagueGameLogParams(season=ctx.season_label, season_type=ctx.season_type, player_or_team="T")
+    team_logs = to_df(await one(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict()))
     if not team_logs.empty:
         team_logs = utils.normalize_columns(team_logs)
-        team_logs["season"] = ctx.season
-        team_logs["season_label"] = ctx.season_label
-        team_logs["season_type"] = ctx.season_type
-    player_logs = to_df(player_p)
+        team_logs = utils.tag_columns(
+            team_logs, season=ctx.season, season_label=ctx.season_label, season_type=ctx.season_type
+        )
+    log.info("  team_game_logs=%d", len(team_logs))
+    return team_logs
+
+
+async def fetch_player_logs(one: OneFn, to_df: ToDfFn, ctx: FetchContext) -> pd.DataFrame:
+    """Player game logs (leaguegamelog, PlayerOrTeam=P).
+
+    Skipped (empty) when ctx.fetch_player_logs is False, and limited to games
+    on/after ctx.player_logs_date_from when set.
+    """
+    if not ctx.fetch_player_logs:
+        return pd.DataFrame()
+    params = LeagueGameLogParams(
+        season=ctx.season_label,
+        season_type=ctx.season_type,
+        player_or_team="P",
+        date_from=ctx.player_logs_date_from,
+    )
+    player_logs = to_df(await one(Endpoint.LEAGUE_GAME_LOG.value, params.to_api_dict()))
     if not player_logs.empty:
         player_logs = utils.normalize_columns(player_logs)
-        player_logs["season"] = ctx.season
-        player_logs["season_label"] = ctx.season_label
-        player_logs["season_type"] = ctx.season_type
-    common = to_df(common_p, name=ResultSet.COMMON_ALL_PLAYERS.value)
+        player_logs = utils.tag_columns(
+            player_logs, season=ctx.season, season_label=ctx.season_label, season_type=ctx.season_type
+        )
+    log.info("  player_game_logs=%d", len(player_logs))
+    return player_logs
+
+
+async def fetch_common_all_players(one: OneFn, to_df: ToDfFn, ctx: FetchContext) -> pd.DataFrame:
+    """commonallplayers: master player list for the season."""
+    params = CommonAllPlayersParams(season=ctx.season_label)
+    p = await one(Endpoint.COMMON_ALL_PLAYERS.value, params.to_api_dict())
+    common = to_df(p, name=ResultSet.COMMON_ALL_PLAYERS.value, index=0)
     if not common.empty:
         common = utils.normalize_columns(common)
-        common["season"] = ctx.season
-        common["season_label"] = ctx.season_label
-    log.info("  team_game_logs=%d, player_game_logs=%d, common_all_players=%d", len(team_logs), len(player_logs), len(common))
+        common = utils.tag_columns(common, season=ctx.season, season_label=ctx.season_label)
+    log.info("  common_all_players=%d", len(common))
+    return common
+
+
+async def fetch_core(
+    one: OneFn, to_df: ToDfFn, ctx: FetchContext
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Team logs, player logs, common_all_players."""
+    log.info("Fetching team logs, player logs, commonallplayers (3 parallel)")
+    team_logs, player_logs, common = await asyncio.gather(
+        fetch_team_logs(one, to_df, ctx),
+        fetch_player_logs(one, to_df, ctx),
+        fetch_common_all_players(one, to_df, ctx),
+    )
     return team_logs, player_logs, common
 
 
@@ -106,47 +222,36 @@ async def fetch_rosters_schedule(
         dates = sorted(dates)[: ctx.limit]
     log.info("Loading rosters for %d teams, schedule for %d dates", len(teams), len(dates))
 
-    async def roster(row: Any) -> pd.DataFrame:
-        tid, abbrev = int(row.team_id), str(row.team_abbreviation)
-        try:
-            params = CommonTeamRosterParams(season=ctx.season_label, team_id=str(tid))
-            p = await one(Endpoint.COMMON_TEAM_ROSTER.value, params.to_api_dict())
-            df = to_df(p, name=ResultSet.COMMON_TEAM_ROSTER.value)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["team_id"] = tid
-            df["team_abbreviation"] = abbrev
-            df["season"] = ctx.season
-            df["season_label"] = ctx.season_label
-            return df
-        except Exception as e:
-            log.warning("Skipping roster team_id=%s: %s", tid, e)
-            return pd.DataFrame()
+    async def roster(tid: int) -> pd.DataFrame:
+        params = CommonTeamRosterParams(season=ctx.season_label, team_id=str(tid))
+        p = await one(Endpoint.COMMON_TEAM_ROSTER.value, params.to_api_dict())
+        return _rows_df(to_df, p, name=ResultSet.COMMON_TEAM_ROSTER.value, index=0)
+
+    date_keys = [str(d) for d in sorted(dates)]
+    api_dates = utils.game_dates_for_api(date_keys)
 
     async def scoreboard(d: str) -> pd.DataFrame:
-        try:
-            params = ScoreboardParams(game_date=_game_date_for_api(d))
-            p = await one(Endpoint.SCOREBOARD.value, params.to_api_dict())
-            df = to_df(p, name=ResultSet.GAME_HEADER.value)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            log.warning("Skipping scoreboard date=%s: %s", d, e)
-            return pd.DataFrame()
+        params = ScoreboardParams(game_date=api_dates[d])
+        p = await one(Endpoint.SCOREBOARD.value, params.to_api_dict())
+        return _rows_df(to_df, p, name=ResultSet.GAME_HEADER.value, index=0)
 
-    roster_list = [roster(row) for row in teams.itertuples(index=False)]
-    sched_list = [scoreboard(str(d)) for d in sorted(dates)]
+    team_ids = teams["team_id"].astype(int).tolist()
     roster_dfs, sched_dfs = await asyncio.gather(
-        asyncio.gather(*roster_list),
-        asyncio.gather(*sched_list),
+        _gather_frames("roster team_id", [roster(tid) for tid in team_ids], team_ids),
+        _gather_frames("scoreboard date", [scoreboard(d) for d in date_keys], date_keys),
+    )
+    rosters = _combine(
+        roster_dfs,
+        per_frame={
+            "team_id": team_ids,
+            "team_abbreviation": teams["team_abbreviation"].astype(str).tolist(),
+        },
+        season=ctx.season,
+        season_label=ctx.season_label,
     )
-    rosters = pd.concat([d for d in roster_dfs if not d.empty], ignore_index=True) if roster_dfs else pd.DataFrame()
-    schedule = pd.concat([d for d in sched_dfs if not d.empty], ignore_index=True) if sched_dfs else pd.DataFrame()
+    if not rosters.empty:
+        rosters["team_abbreviation"] = rosters["team_abbreviation"].astype("category")
+    schedule = _combine(sched_dfs, season=ctx.season, season_type=ctx.season_type)
     if not schedule.empty:
         schedule = schedule.drop_duplicates(subset=["game_id"])
     log.info("  team_rosters=%d, schedule=%d games", len(rosters), len(schedule))
@@ -168,13 +273,13 @@ async def fetch_reference(
     )
     ct = utils.normalize_columns(to_df(a, index=0))
     if not ct.empty:
-        ct["season"] = ctx.season
+        ct = utils.tag_columns(ct, season=ctx.season)
     dh = utils.normalize_columns(to_df(b, index=0))
     if not dh.empty:
-        dh["season"] = ctx.season
+        dh = utils.tag_columns(dh, season=ctx.season)
     cps = utils.normalize_columns(to_df(c, index=0))
     if not cps.empty:
-        cps["season"] = ctx.season
+        cps = utils.tag_columns(cps, season=ctx.season)
     log.info("  common_team_years=%d, draft_history=%d, common_playoff_series=%d", len(ct), len(dh), len(cps))
     return ct, dh, cps
 
@@ -194,32 +299,22 @@ async def fetch_lineups(
         league = to_df(p, index=0)
         if not league.empty:
             league = utils.normalize_columns(league)
-            league["season"] = ctx.season
-            league["season_type"] = ctx.season_type
+            league = utils.tag_columns(league, season=ctx.season, season_type=ctx.season_type)
     except Exception as e:
         log.warning("leaguedashlineups failed: %s", e)
-    team_ids = team_logs["team_id"].drop_duplicates().dropna().astype(int).unique().tolist() if not team_logs.empty and "team_id" in team_logs.columns else []
+    team_ids = utils.unique_int_ids(team_logs["team_id"]) if not team_logs.empty and "team_id" in team_logs.columns else []
     if ctx.limit is not None:
         team_ids = team_ids[: ctx.limit]
     team_lineups = pd.DataFrame()
     if team_ids:
         async def tl(tid: int) -> pd.DataFrame:
-            try:
-                tdl_params = TeamDashLineupsParams(season=ctx.season_label, season_type=ctx.season_type, team_id=str(tid))
-                p = await one(Endpoint.TEAM_DASH_LINEUPS.value, tdl_params.to_api_dict())
-                df = to_df(p, index=0)
-                if df.empty:
-                    return df
-                df = utils.normalize_columns(df)
-                df["team_id"] = tid
-                df["season"] = ctx.season
-                df["season_type"] = ctx.season_type
-                return df
-            except Exception as e:
-                log.warning("teamdashlineups team_id=%s: %s", tid, e)
-                return pd.DataFrame()
-        dfs = await asyncio.gather(*[tl(tid) for tid in team_ids])
-        team_lineups = pd.concat([d for d in dfs if not d.empty], ignore_index=True) if dfs else pd.DataFrame()
+            tdl_params = TeamDashLineupsParams(season=ctx.season_label, season_type=ctx.season_type, team_id=str(tid))
+            p = await one(Endpoint.TEAM_DASH_LINEUPS.value, tdl_params.to_api_dict())
+            return _rows_df(to_df, p, index=0)
+        dfs = await _gather_frames("teamdashlineups team_id", [tl(tid) for tid in team_ids], team_ids)
+        team_lineups = _combine(
+            dfs, per_frame={"team_id": team_ids}, season=ctx.season, season_type=ctx.season_type
+        )
     log.info("  league_dash_lineups=%d, team_dash_lineups=%d", len(league), len(team_lineups))
     return league, team_lineups
 
@@ -230,81 +325,54 @@ async def fetch_box_and_pbp(
     """box_summaries, box_advanced, box_traditional, playbyplay."""
     if team_logs.empty or "game_id" not in team_logs.columns:
         return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
-    game_ids = team_logs["game_id"].dropna().astype(str).str.strip().unique().tolist()
+    game_ids = utils.unique_str_ids(team_logs["game_id"])
     if ctx.limit is not None:
         game_ids = game_ids[: ctx.limit]
+    if not game_ids:
+        return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
     log.info("Loading box scores and play-by-play for %d games", len(game_ids))
 
-    async def box(gid: str):
-        try:
-            params = BoxScoreParams(game_id=gid)
-            p = await one(Endpoint.BOX_SCORE_SUMMARY.value, params.to_api_dict())
-            df = to_df(p, name=ResultSet.GAME_SUMMARY.value)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            log.warning("box summary game_id=%s: %s", gid, e)
-            return pd.DataFrame()
-
-    async def adv(gid: str):
-        try:
-            params = BoxScoreParams(game_id=gid)
-            p = await one(Endpoint.BOX_SCORE_ADVANCED.value, params.to_api_dict())
-            df = to_df(p, index=0)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["game_id"] = gid
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            return pd.DataFrame()
-
-    async def trad(gid: str):
-        try:
-            params = BoxScoreParams(game_id=gid)
-            p = await one(Endpoint.BOX_SCORE_TRADITIONAL.value, params.to_api_dict())
-            df = to_df(p, index=0)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["game_id"] = gid
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            return pd.DataFrame()
-
-    async def pbp(gid: str):
-        try:
-            params = PlayByPlayParams(game_id=gid)
-            p = await one(Endpoint.PLAY_BY_PLAY.value, params.to_api_dict())
-            df = to_df(p, index=0)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["game_id"] = gid
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            return pd.DataFrame()
-
-    box_dfs, adv_dfs, trad_dfs, pbp_dfs = await asyncio.gather(
-        asyncio.gather(*[box(gid) for gid in game_ids]),
-        asyncio.gather(*[adv(gid) for gid in game_ids]),
-        asyncio.gather(*[trad(gid) for gid in game_ids]),
-        asyncio.gather(*[pbp(gid) for gid in game_ids]),
+    async def per_game(gid: str) -> list:
+        # All four endpoints share the game id; one coroutine per game, params built once
+        box_params = BoxScoreParams(game_id=gid).to_api_dict()
+        pbp_params = PlayByPlayParams(game_id=gid).to_api_dict()
+        box, *rest = await asyncio.gather(
+            one(Endpoint.BOX_SCORE_SUMMARY.value, box_params),
+            one(Endpoint.BOX_SCORE_ADVANCED.value, box_params),
+            one(Endpoint.BOX_SCORE_TRADITIONAL.value, box_params),
+            one(Endpoint.PLAY_BY_PLAY.value, pbp_params),
+            return_exceptions=True,
+        )
+        # Parse as soon as the game completes, so raw JSON is only held for games in flight;
+        # a malformed response becomes that slot's exception like a failed request
+        def parse(result: Any, fn: Callable[[Any], Any]) -> Any:
+            if isinstance(result, BaseException):
+                return result
+            try:
+                return fn(result)
+            except Exception as e:
+                return e
+
+        box = parse(
+            box,
+            lambda p: {"resultSet": api.select_resultset(p, name=ResultSet.GAME_SUMMARY.value)},
+        )
+        return [box] + [parse(r, lambda p: _rows_df(to_df, p, index=0)) for r in rest]
+
+    per_endpoint = list(zip(*await asyncio.gather(*(per_game(gid) for gid in game_ids)), strict=True))
+    box_payloads = _unwrap_results("box summary game_id", game_ids, list(per_endpoint[0]), {})
+    labels = ("box advanced", "box traditional", "playbyplay")
+    adv_dfs, trad_dfs, pbp_dfs = (
+        _unwrap_results(f"{label} game_id", game_ids, list(results), _EMPTY_DF)
+        for label, results in zip(labels, per_endpoint[1:], strict=True)
+    )
+    tags = {"season": ctx.season, "season_type": ctx.season_type}
+    box_sum = _combine(
+        [to_df(p) for p in _merge_payloads(box_payloads, name=ResultSet.GAME_SUMMARY.value)], **tags
     )
-    box_sum = pd.concat([d for d in box_dfs if not d.empty], ignore_index=True) if box_dfs else pd.DataFrame()
-    box_adv = pd.concat([d for d in adv_dfs if not d.empty], ignore_index=True) if adv_dfs else pd.DataFrame()
-    box_trad = pd.concat([d for d in trad_dfs if not d.empty], ignore_index=True) if trad_dfs else pd.DataFrame()
-    pbp_df = pd.concat([d for d in pbp_dfs if not d.empty], ignore_index=True) if pbp_dfs else pd.DataFrame()
+    box_adv = _combine(adv_dfs, per_frame={"game_id": game_ids}, **tags)
+    box_trad = _combine(trad_dfs, per_frame={"game_id": game_ids}, **tags)
+    pbp_df = _combine(pbp_dfs, per_frame={"game_id": game_ids}, **tags)
     log.info("  box_summaries=%d, box_advanced=%d, box_traditional=%d, playbyplay=%d", len(box_sum), len(box_adv), len(box_trad), len(pbp_df))
     return box_sum, box_adv, box_trad, pbp_df
 
@@ -316,59 +384,92 @@ async def fetch_shot_charts(
     if box_summaries.empty or "home_team_id" not in box_summaries.columns:
         return pd.DataFrame()
     rows = box_summaries[["game_id", "home_team_id", "visitor_team_id"]].drop_duplicates()
-    tasks = []
-    for _, row in rows.iterrows():
-        for tid in (int(row["home_team_id"]), int(row["visitor_team_id"])):
-            tasks.append((str(row["game_id"]), tid))
+    # One task pair per game: conflicting team ids for a game_id would duplicate requests
+    if rows["game_id"].duplicated().any():
+        log.warning("box_summaries has conflicting team ids for some games; keeping the first")
+        rows = rows.drop_duplicates(subset=["game_id"])
+    gids = rows["game_id"].astype(str).tolist()
+    home = rows["home_team_id"].to_numpy(dtype=np.int64).tolist()
+    visitor = rows["visitor_team_id"].to_numpy(dtype=np.int64).tolist()
+    tasks = [(gid, tid) for gid, h, v in zip(gids, home, visitor, strict=True) for tid in (h, v)]
     log.info("Loading shot charts for %d game-team pairs", len(tasks))
 
     async def fetch(gid: str, tid: int) -> pd.DataFrame:
-        try:
-            params = ShotChartParams(season=ctx.season_label, season_type=ctx.season_type, game_id=gid, team_id=str(tid))
-            p = await one(Endpoint.SHOT_CHART.value, params.to_api_dict())
-            df = to_df(p, index=0)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["game_id"] = gid
-            df["team_id"] = tid
-            df["season"] = ctx.season
-            df["season_type"] = ctx.season_type
-            return df
-        except Exception as e:
-            return pd.DataFrame()
-
-    dfs = await asyncio.gather(*[fetch(gid, tid) for gid, tid in tasks])
-    out = pd.concat([d for d in dfs if not d.empty], ignore_index=True) if dfs else pd.DataFrame()
+        params = ShotChartParams(season=ctx.season_label, season_type=ctx.season_type, game_id=gid, team_id=str(tid))
+        p = await one(Endpoint.SHOT_CHART.value, params.to_api_dict())
+        return _rows_df(to_df, p, index=0)
+
+    dfs = await _gather_frames("shot chart game_id/team_id", [fetch(gid, tid) for gid, tid in tasks], tasks)
+    out = _combine(
+        dfs,
+        per_frame={"game_id": [gid for gid, _ in tasks], "team_id": [tid for _, tid in tasks]},
+        season=ctx.season,
+        season_type=ctx.season_type,
+    )
     log.info("  shot_charts=%d", len(out))
     return out
 
 
+# playerindex columns under their commonplayerinfo (player_info) names
+_PLAYER_INDEX_RENAMES = {
+    "player_first_name": "first_name",
+    "player_last_name": "last_name",
+    "college": "school",
+    "jersey_number": "jersey",
+}
+
+
+async def fetch_player_index(one: OneFn, to_df: ToDfFn, ctx: FetchContext) -> pd.DataFrame:
+    """Bios of every player in the season from one playerindex call, as player_info columns.
+
+    playerindex has no birthdate, so that column is null.
+    """
+    params = PlayerIndexParams(season=ctx.season_label)
+    p = await one(Endpoint.PLAYER_INDEX.value, params.to_api_dict())
+    df = _rows_df(to_df, p, name=ResultSet.PLAYER_INDEX.value, index=0)
+    if df.empty:
+        return df
+    df = utils.normalize_columns(df).rename(columns=_PLAYER_INDEX_RENAMES)
+    if "first_name" in df.columns and "last_name" in df.columns:
+        df["display_first_last"] = df["first_name"] + " " + df["last_name"]
+    df["birthdate"] = pd.array([None] * len(df), dtype=pd.ArrowDtype(pa.string()))
+    return df
+
+
 async def fetch_player_info(
     one: OneFn, to_df: ToDfFn, ctx: FetchContext, common_players: pd.DataFrame
 ) -> pd.DataFrame:
-    """Player info (bio). Depends on common_all_players."""
+    """Player info (bio). Depends on common_all_players.
+
+    With ctx.player_index the bios come from one playerindex call; only players it
+    does not list are fetched one commonplayerinfo call each.
+    """
     if common_players.empty or "person_id" not in common_players.columns:
         return pd.DataFrame()
-    pids = common_players["person_id"].dropna().unique().tolist()
+    pids = utils.unique_int_ids(common_players["person_id"])
     if ctx.limit is not None:
         pids = pids[: ctx.limit]
-    log.info("Loading player info for %d players", len(pids))
-
-    async def fetch(pid: Any) -> pd.DataFrame:
+    index = pd.DataFrame()
+    if ctx.player_index:
         try:
-            params = CommonPlayerInfoParams(player_id=str(pid))
-            p = await one(Endpoint.COMMON_PLAYER_INFO.value, params.to_api_dict())
-            df = to_df(p, name=ResultSet.COMMON_PLAYER_INFO.value)
-            if df.empty:
-                return df
-            df = utils.normalize_columns(df)
-            df["season"] = ctx.season
-            return df
+            index = await fetch_player_index(one, to_df, ctx)
         except Exception as e:
-            return pd.DataFrame()
+            log.warning("playerindex failed (%s); using commonplayerinfo for every player", e)
+        if not index.empty:
+            index = index[index["person_id"].isin(pids)]
+            listed = set(utils.unique_int_ids(index["person_id"]))
+            pids = [pid for pid in pids if pid not in listed]
+            log.info("  playerindex: %d players; %d more via commonplayerinfo", len(listed), len(pids))
+    log.info("Loading player info for %d players", len(pids))
+
+    async def fetch(pid: Any) -> dict:
+        params = CommonPlayerInfoParams(player_id=str(pid))
+        return await one(Endpoint.COMMON_PLAYER_INFO.value, params.to_api_dict())
 
-    dfs = await asyncio.gather(*[fetch(pid) for pid in pids])
-    out = pd.concat([d for d in dfs if not d.empty], ignore_index=True) if dfs else pd.DataFrame()
+    payloads = await _gather_results("player info person_id", [fetch(pid) for pid in pids], pids, {})
+    merged = _merge_payloads(payloads, name=ResultSet.COMMON_PLAYER_INFO.value)
+    out = _combine([to_df(p) for p in merged], season=ctx.season)
+    if not index.empty:
+        out = utils.concat_frames([utils.tag_columns(index, season=ctx.season), out])
     log.info("  player_info=%d", len(out))
     return out
@@ -12,6 +12,7 @@ from load.nba.models.endpoints import (
     LeagueDashLineupsParams,
     LeagueGameLogParams,
     PlayByPlayParams,
+    PlayerIndexParams,
     ResultSet,
     ScoreboardParams,
     ShotChartParams,
@@ -30,6 +31,7 @@ __all__ = [
     "LeagueDashLineupsParams",
     "LeagueGameLogParams",
     "PlayByPlayParams",
+    "PlayerIndexParams",
     "ResultSet",
     "ScoreboardParams",
     "ShotChartParams",
@@ -25,6 +25,7 @@ class Endpoint(str, Enum):
     PLAY_BY_PLAY = "playbyplayv3"
     SHOT_CHART = "shotchartdetail"
     COMMON_PLAYER_INFO = "commonplayerinfo"
+    PLAYER_INDEX = "playerindex"
 
 
 # --- Result set names ---
@@ -36,6 +37,7 @@ class ResultSet(str, Enum):
     GAME_HEADER = "GameHeader"
     GAME_SUMMARY = "GameSummary"
     COMMON_PLAYER_INFO = "CommonPlayerInfo"
+    PLAYER_INDEX = "PlayerIndex"
 
 
 LEAGUE_ID_NBA = "00"
@@ -54,9 +56,10 @@ class LeagueGameLogParams(BaseModel):
     season: str = Field(..., alias="Season")
     season_type: str = Field(..., alias="SeasonType")
     sorter: str = Field(default="DATE", alias="Sorter")
+    date_from: str | None = Field(default=None, alias="DateFrom")
 
     def to_api_dict(self) -> dict[str, str]:
-        return {
+        d = {
             "Counter": self.counter,
             "Direction": self.direction,
             "LeagueID": self.league_id,
@@ -65,6 +68,9 @@ class LeagueGameLogParams(BaseModel):
             "SeasonType": self.season_type,
             "Sorter": self.sorter,
         }
+        if self.date_from:
+            d["DateFrom"] = self.date_from
+        return d
 
 
 class CommonAllPlayersParams(BaseModel):
@@ -243,3 +249,18 @@ class CommonPlayerInfoParams(BaseModel):
 
     def to_api_dict(self) -> dict[str, str]:
         return {"LeagueID": self.league_id, "PlayerID": self.player_id}
+
+
+class PlayerIndexParams(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    league_id: str = Field(default=LEAGUE_ID_NBA, alias="LeagueID")
+    season: str = Field(..., alias="Season")
+    historical: str = Field(default="0", alias="Historical")
+
+    def to_api_dict(self) -> dict[str, str]:
+        return {
+            "LeagueID": self.league_id,
+            "Season": self.season,
+            "Historical": self.historical,
+        }
@@ -109,16 +109,15 @@ def load_player_box_scores_and_schedule(
     log.info("Loading NCAA box scores and schedule for %d games", len(contest_ids))
     player_frames: list[pd.DataFrame] = []
     game_rows: list[dict] = []
+    player_rows = 0
     for i, cid in enumerate(contest_ids):
         try:
             html = get_box_score_page(cid)
             df = parse_box_score_player_stats(html, cid)
             if not df.empty:
-                df["season"] = season
                 player_frames.append(df)
-            info = parse_box_score_game_info(html, cid)
-            info["season"] = season
-            game_rows.append(info)
+                player_rows += len(df)
+            game_rows.append(parse_box_score_game_info(html, cid))
         except Exception as e:
             log.warning("box score contest_id=%s: %s", cid, e)
         if (i + 1) % 50 == 0:
@@ -126,15 +125,14 @@ def load_player_box_scores_and_schedule(
                 "  box scores: %d/%d games, %d player-rows",
                 i + 1,
                 len(contest_ids),
-                sum(len(f) for f in player_frames),
+                player_rows,
             )
-    player_df = (
-        utils.normalize_columns(pd.concat(player_frames, ignore_index=True))
-        if player_frames
-        else pd.DataFrame()
-    )
+    # One concat of all games, after the loop (utils.concat_frames skips empties)
+    player_df = utils.concat_frames(player_frames)
+    if not player_df.empty:
+        player_df = utils.tag_columns(utils.normalize_columns(player_df), season=season)
     schedule_df = (
-        utils.normalize_columns(pd.DataFrame(game_rows))
+        utils.tag_columns(utils.normalize_columns(pd.DataFrame(game_rows)), season=season)
         if game_rows
         else pd.DataFrame()
     )
@@ -82,10 +82,12 @@ def load_game_list(
         contest_ids = parse_contest_ids_from_html(html)
         if contest_ids:
             if not games_df.empty:
-                games_df = utils.normalize_columns(games_df)
-                games_df["season"] = season
-                games_df["division"] = division
-                games_df["sport_code"] = sport_code
+                games_df = utils.tag_columns(
+                    utils.normalize_columns(games_df),
+                    season=season,
+                    division=division,
+                    sport_code=sport_code,
+                )
             if limit:
                 contest_ids = contest_ids[:limit]
                 if not games_df.empty:
@@ -44,7 +44,7 @@ def main():
     with ncaa_session() as get_html:
         teams = get_teams(get_html)
         df = pd.DataFrame(teams)
-        df.to_csv("teams.csv", index=False)
+        df.to_parquet("teams.parquet", compression="zstd", index=False)
 
 
 if __name__ == "__main__":
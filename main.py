@@ -2,9 +2,17 @@
 from __future__ import annotations
 
 import json
+import os
 
 # 3rd Party Imports
 import requests as r
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used instead
+    orjson = None
 
 API_URL = "https://stats.nba.com/stats/{endpoint}"
 STATS_HEADERS = {
@@ -21,25 +29,82 @@ STATS_HEADERS = {
     "Sec-Ch-Ua-Mobile": "?0",
     "Sec-Fetch-Dest": "empty",
 }
+# (connect, read) seconds
+REQUEST_TIMEOUT = (5, 30)
+# Opt-in response cache (NBA_HTTP_CACHE=1); off by default so fetches stay live
+HTTP_CACHE = os.getenv("NBA_HTTP_CACHE") == "1"
+
+# One pooled session for every call: keep-alive instead of a new TCP+TLS handshake
+# per request, and urllib3 retries 429/5xx with exponential backoff
+_SESSION = r.Session()
+_SESSION.headers.update(STATS_HEADERS)
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=1.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+        ),
+    ),
+)
+
+
+def clear_session() -> None:
+    """Close the pooled connections; the next call opens a fresh one."""
+    _SESSION.close()
+
+
+def _loads(body: bytes) -> dict:
+    """Decode a JSON response body (orjson when installed)."""
+    return orjson.loads(body) if orjson is not None else json.loads(body)
+
+
+def _get(endpoint: str) -> bytes:
+    """GET one endpoint through the pooled session and return the raw body."""
+    resp = _SESSION.get(API_URL.format(endpoint=endpoint), timeout=REQUEST_TIMEOUT)
+    resp.raise_for_status()
+    return resp.content
 
 
 def call_api(endpoint: str) -> json:
     """Call the NBA API endpoint
 
+    With NBA_HTTP_CACHE=1, responses are kept in the on-disk response cache for
+    NBA_CACHE_SHORT_TTL_SECONDS, so repeated runs don't re-request the same endpoint.
+
     Args:
         endpoint (str): The suffix of the endpoint.
 
     Returns:
         json: response from the API endpoint
     """
-    return r.get(API_URL.format(endpoint=endpoint), headers=STATS_HEADERS).json()
+    if not HTTP_CACHE:
+        return _loads(_get(endpoint))
+    # Imported only when caching is asked for: the cache module pulls in pandas
+    from load.modules import cache
+
+    body = cache.read_body(endpoint, {}, cache.SHORT_TTL_SECONDS)
+    if body is not None:
+        return _loads(body)
+    body = _get(endpoint)
+    payload = _loads(body)
+    cache.write_body(endpoint, {}, body)
+    return payload
 
 
 def main() -> None:
     endpoint = "teams"
     endpoint_data = call_api(endpoint=endpoint)
-    with open("sample.json", "w") as f:
-        json.dump(endpoint_data, f, indent=2)
+    if orjson is not None:
+        with open("sample.json", "wb") as f:
+            f.write(orjson.dumps(endpoint_data, option=orjson.OPT_INDENT_2))
+    else:
+        with open("sample.json", "w") as f:
+            json.dump(endpoint_data, f, indent=2)
 
 
 if __name__ == "__main__":
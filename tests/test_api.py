@@ -0,0 +1,28 @@
+"""Tests for load.nba.api."""
+
+import pandas as pd
+import pyarrow as pa
+
+from load.modules import utils
+from load.nba import api
+
+
+def test_rows_to_df_keeps_mixed_column_as_strings():
+    df = api._rows_to_df([[1, 3], [2, "R"], [3, None]], ["PLAYER_ID", "EXP"])
+
+    assert df["EXP"].dtype == pd.ArrowDtype(pa.string())
+    assert df["EXP"].tolist()[:2] == ["3", "R"]
+    assert df["EXP"].isna().tolist() == [False, False, True]
+
+
+def test_frames_typed_differently_per_response_concat_to_strings():
+    veterans = api._rows_to_df([[1, 3], [2, 7]], ["PLAYER_ID", "EXP"])
+    rookies = api._rows_to_df([[3, "R"]], ["PLAYER_ID", "EXP"])
+    assert veterans["EXP"].dtype == pd.ArrowDtype(pa.int64())
+    assert rookies["EXP"].dtype == pd.ArrowDtype(pa.string())
+
+    out = utils.concat_frames([veterans, rookies])
+
+    assert out["EXP"].dtype == pd.ArrowDtype(pa.string())
+    assert out["EXP"].tolist() == ["3", "7", "R"]
+    assert out["PLAYER_ID"].dtype == pd.ArrowDtype(pa.int64())
@@ -0,0 +1,16 @@
+"""Tests for load.nba.fetch."""
+
+import pandas as pd
+
+from load.modules import cache
+from load.nba import fetch
+
+
+def test_common_player_info_ttl():
+    bio = pd.DataFrame({"person_id": [1]})
+
+    assert fetch._common_player_info_ttl({"season": "2020"}, bio) == cache.FOREVER
+    assert fetch._common_player_info_ttl({"season": "2099"}, bio) == cache.SHORT_TTL_SECONDS
+    assert fetch._common_player_info_ttl({"season": "2020"}, bio.iloc[:0]) == (
+        cache.SHORT_TTL_SECONDS
+    )
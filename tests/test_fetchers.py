@@ -0,0 +1,58 @@
+"""Tests for load.nba.fetchers."""
+
+import asyncio
+
+import pandas as pd
+
+from load.modules import warehouse
+from load.nba import api, fetchers
+from load.nba.models import Endpoint, ResultSet
+
+_INDEX = {
+    "resultSets": [
+        {
+            "name": ResultSet.PLAYER_INDEX.value,
+            "headers": ["PERSON_ID", "PLAYER_FIRST_NAME", "PLAYER_LAST_NAME", "DRAFT_YEAR"],
+            "rowSet": [[1, "Al", "Horford", 2007]],
+        }
+    ]
+}
+
+_INFO = {
+    "resultSets": [
+        {
+            "name": ResultSet.COMMON_PLAYER_INFO.value,
+            "headers": ["PERSON_ID", "FIRST_NAME", "LAST_NAME", "DRAFT_YEAR"],
+            "rowSet": [[2, "Jo", "Doe", "Undrafted"]],
+        }
+    ]
+}
+
+
+async def _one(endpoint: str, params: dict[str, str]) -> dict:
+    return _INDEX if endpoint == Endpoint.PLAYER_INDEX.value else _INFO
+
+
+def test_player_info_from_index_and_fallback_writes_to_duckdb(tmp_path):
+    ctx = fetchers.FetchContext(
+        season="2026",
+        season_label="2025-26",
+        season_type="Regular Season",
+        limit=None,
+        skip_lineups=False,
+        player_index=True,
+    )
+    common_players = pd.DataFrame({"person_id": [1, 2]})
+
+    df = asyncio.run(fetchers.fetch_player_info(_one, api.resultset_to_df, ctx, common_players))
+
+    assert df.sort_values("person_id")["draft_year"].tolist() == ["2007", "Undrafted"]
+    con = warehouse.init_duckdb(str(tmp_path / "bronze.duckdb"))
+    try:
+        warehouse.write_duckdb_for_season(con, {"player_info": df}, season="2026", source="nba")
+        rows = con.execute(
+            "SELECT person_id, draft_year FROM nba.player_info ORDER BY person_id"
+        ).fetchall()
+    finally:
+        con.close()
+    assert rows == [(1, "2007"), (2, "Undrafted")]
@@ -0,0 +1,60 @@
+"""Tests for load.modules.utils."""
+
+import pandas as pd
+import pyarrow as pa
+
+from load.modules import utils, warehouse
+
+
+def _arrow(values, pa_type):
+    return pd.array(values, dtype=pd.ArrowDtype(pa_type))
+
+
+def test_concat_frames_unifies_conflicting_arrow_types():
+    a = pd.DataFrame({"EXP": _arrow([3, 4], pa.int64()), "WEIGHT": _arrow([200, 210], pa.int64())})
+    b = pd.DataFrame({"EXP": _arrow(["R"], pa.string()), "WEIGHT": _arrow([195.5], pa.float64())})
+
+    out = utils.concat_frames([a, b])
+
+    assert out["EXP"].dtype == pd.ArrowDtype(pa.string())
+    assert out["EXP"].tolist() == ["3", "4", "R"]
+    assert out["WEIGHT"].dtype == pd.ArrowDtype(pa.float64())
+    assert out["WEIGHT"].tolist() == [200.0, 210.0, 195.5]
+
+
+def test_concat_frames_with_conflicting_types_writes_to_duckdb(tmp_path):
+    # Other Arrow-backed columns make DuckDB register the frame through pyarrow, which
+    # is what fails on a mixed int/str object column.
+    a = pd.DataFrame(
+        {"season": ["2026"], "PLAYER_ID": _arrow([1], pa.int64()), "EXP": _arrow([3], pa.int64())}
+    )
+    b = pd.DataFrame(
+        {
+            "season": ["2026"],
+            "PLAYER_ID": _arrow([2], pa.int64()),
+            "EXP": _arrow(["R"], pa.string()),
+        }
+    )
+    df = utils.concat_frames([a, b])
+
+    con = warehouse.init_duckdb(str(tmp_path / "bronze.duckdb"))
+    try:
+        warehouse.write_duckdb_for_season(con, {"rosters": df}, season="2026", source="nba")
+        rows = con.execute("SELECT EXP FROM nba.rosters ORDER BY EXP").fetchall()
+        exp_type = con.execute(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = 'nba' AND table_name = 'rosters' AND column_name = 'EXP'"
+        ).fetchone()[0]
+    finally:
+        con.close()
+
+    assert rows == [("3",), ("R",)]
+    assert exp_type == "VARCHAR"
+
+
+def test_unique_ids_keep_first_seen_order():
+    game_ids = pd.Series(["0022500003", " 0022500001", None, "0022500003 ", "0022500002"])
+    person_ids = pd.Series([30, 10, None, 30, 20])
+
+    assert utils.unique_str_ids(game_ids) == ["0022500003", "0022500001", "0022500002"]
+    assert utils.unique_int_ids(person_ids) == [30, 10, 20]